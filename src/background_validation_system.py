@@ -7,7 +7,7 @@ with the Phase 2 selection and action systems. Ensures all operations
 maintain syntactic validity and provides intelligent feedback.
 """
 
-from typing import Set, Dict, List, Optional, Tuple, Callable
+from typing import Set, Dict, List, Optional, Tuple, Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import threading
@@ -20,6 +20,34 @@ from eg_transformation_rules import (
 )
 
 
+# Suggestion templates for get_action_suggestions, built once at import
+_EMPTY_SELECTION_SUGGESTIONS = (
+    "Select elements to see available actions",
+    "Drag to select area for insertion operations",
+    "Use transformation rules for logical operations"
+)
+_EDGE_SUGGESTIONS = (
+    "Edit predicate name or arity",
+    "Delete predicate (Erasure rule)",
+    "Copy to broader context (Iteration rule)"
+)
+_VERTEX_SUGGESTIONS = (
+    "Connect to predicates",
+    "Delete vertex (Erasure rule)",
+    "Branch Line of Identity"
+)
+_CUT_SUGGESTIONS = (
+    "Delete cut contents",
+    "Check for double cut deletion",
+    "Insert elements inside cut"
+)
+_MULTI_SELECTION_SUGGESTIONS = (
+    "Enclose selection with cut",
+    "Delete selected elements (Erasure rule)",
+    "Apply transformation rules to subgraph"
+)
+
+
 class ValidationLevel(Enum):
     """Levels of validation strictness."""
     PERMISSIVE = "permissive"    # Allow most operations
@@ -33,13 +61,9 @@ class ValidationFeedback:
     is_valid: bool
     level: ValidationLevel
     message: str
-    suggestions: List[str]
-    available_transformations: List[Dict]
-    warnings: List[str] = None
-    
-    def __post_init__(self):
-        if self.warnings is None:
-            self.warnings = []
+    suggestions: Sequence[str]
+    available_transformations: Sequence[Dict]
+    warnings: Sequence[str] = ()
 
 
 class RealTimeValidator:
@@ -59,6 +83,18 @@ class RealTimeValidator:
         # Cache for performance
         self.validation_cache = {}
         self.cache_timeout = 1.0  # seconds
+        self._graph_hash_memo: Optional[Tuple[RelationalGraphWithCuts, int]] = None
+        
+        # Action type -> validation handler, looked up once per action
+        self._action_validators: Dict[str, Callable[..., ValidationFeedback]] = {
+            "insert_cut": self._validate_cut_insertion,
+            "insert_predicate": self._validate_predicate_insertion,
+            "insert_loi": self._validate_loi_insertion,
+            "delete": self._validate_deletion,
+            "move": self._validate_movement,
+            "edit_predicate": self._validate_predicate_edit,
+            "apply_transformation": self._validate_transformation_application,
+        }
         
     def add_validation_callback(self, callback: Callable[[ValidationFeedback], None]):
         """Add callback for validation feedback updates."""
@@ -100,40 +136,18 @@ class RealTimeValidator:
                                   action_params: Dict) -> ValidationFeedback:
         """Perform the actual validation logic."""
         
-        suggestions = []
-        warnings = []
-        available_transformations = []
-        
         # Validate based on action type
-        if action_type == "insert_cut":
-            return self._validate_cut_insertion(graph, selection, action_params)
-        
-        elif action_type == "insert_predicate":
-            return self._validate_predicate_insertion(graph, selection, action_params)
-        
-        elif action_type == "insert_loi":
-            return self._validate_loi_insertion(graph, selection, action_params)
-        
-        elif action_type == "delete":
-            return self._validate_deletion(graph, selection, action_params)
-        
-        elif action_type == "move":
-            return self._validate_movement(graph, selection, action_params)
-        
-        elif action_type == "edit_predicate":
-            return self._validate_predicate_edit(graph, selection, action_params)
+        validate = self._action_validators.get(action_type)
+        if validate is not None:
+            return validate(graph, selection, action_params)
         
-        elif action_type == "apply_transformation":
-            return self._validate_transformation_application(graph, selection, action_params)
-        
-        else:
-            return ValidationFeedback(
-                is_valid=False,
-                level=self.validation_level,
-                message=f"Unknown action type: {action_type}",
-                suggestions=[],
-                available_transformations=[]
-            )
+        return ValidationFeedback(
+            is_valid=False,
+            level=self.validation_level,
+            message=f"Unknown action type: {action_type}",
+            suggestions=(),
+            available_transformations=()
+        )
     
     def _validate_cut_insertion(self, graph: RelationalGraphWithCuts,
                                selection: Set[ElementID],
@@ -193,7 +207,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="Predicate arity must be at least 1",
                 suggestions=["Use arity ≥ 1 for valid predicates"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         suggestions.append(f"Will create {arity}-ary predicate '{predicate_name}'")
@@ -243,7 +257,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="No elements selected for deletion",
                 suggestions=["Select elements to delete"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         # Use transformation engine to validate erasure
@@ -259,15 +273,16 @@ class RealTimeValidator:
             suggestions.append(f"Will erase {len(selection)} elements")
             
             # Check for orphaned elements
-            edges_to_delete = selection & graph.E
+            edges_to_delete = selection & graph._edge_map.keys()
+            orphaned_vertices = set()  # a vertex on several deleted edges warns once
             for edge_id in edges_to_delete:
                 if edge_id in graph.nu:
                     vertex_ids = graph.nu[edge_id]
                     for vertex_id in vertex_ids:
-                        # Check if vertex will become orphaned
-                        connected_edges = [eid for eid, vids in graph.nu.items() 
-                                         if vertex_id in vids and eid not in selection]
-                        if not connected_edges:
+                        # Check if vertex will become orphaned: ask the incident
+                        # edge index about this vertex instead of scanning all of ν
+                        if vertex_id not in orphaned_vertices and graph.get_incident_edges(vertex_id) <= selection:
+                            orphaned_vertices.add(vertex_id)
                             warnings.append(f"Vertex {vertex_id[-8:]} will become orphaned")
         
         return ValidationFeedback(
@@ -290,7 +305,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="No elements selected for movement",
                 suggestions=["Select elements to move"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         suggestions = [
@@ -328,7 +343,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="Select exactly one predicate to edit",
                 suggestions=["Single predicate selection required"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         element_id = next(iter(selection))
@@ -339,7 +354,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="Selected element is not a predicate",
                 suggestions=["Select a predicate (edge) to edit"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         current_name = graph.rel.get(element_id, "Unknown")
@@ -377,7 +392,7 @@ class RealTimeValidator:
                 level=self.validation_level,
                 message="No transformation rule specified",
                 suggestions=["Select a transformation rule"],
-                available_transformations=[]
+                available_transformations=()
             )
         
         # Use transformation engine to validate
@@ -406,18 +421,20 @@ class RealTimeValidator:
     
     def _find_element_area(self, graph: RelationalGraphWithCuts, element_id: ElementID) -> Optional[ElementID]:
         """Find which area contains the given element."""
-        
-        for area_id, elements in graph.area.items():
-            if element_id in elements:
-                return area_id
-        return None
+        return graph._context_map.get(element_id)
     
     def _create_cache_key(self, graph: RelationalGraphWithCuts, action_type: str,
                          selection: Set[ElementID], params: Dict) -> str:
         """Create cache key for validation result."""
         
-        # Simple hash-based key (could be more sophisticated)
-        graph_hash = hash(frozenset(graph.V) | frozenset(graph.E) | frozenset(graph.Cut))
+        # Simple hash-based key (could be more sophisticated); graphs are
+        # immutable, so the element hash of the last graph seen is reused
+        memo = self._graph_hash_memo
+        if memo is not None and memo[0] is graph:
+            graph_hash = memo[1]
+        else:
+            graph_hash = hash(graph.V | graph.E | graph.Cut)
+            self._graph_hash_memo = (graph, graph_hash)
         selection_hash = hash(frozenset(selection))
         params_hash = hash(frozenset(params.items()) if params else frozenset())
         
@@ -469,42 +486,21 @@ class ValidationIntegration:
                               selected_elements: Set[ElementID]) -> List[str]:
         """Get suggestions for actions based on current selection."""
         
-        suggestions = []
-        
         if not selected_elements:
-            suggestions.extend([
-                "Select elements to see available actions",
-                "Drag to select area for insertion operations",
-                "Use transformation rules for logical operations"
-            ])
-        elif len(selected_elements) == 1:
-            element_id = next(iter(selected_elements))
-            if element_id in graph.E:
-                suggestions.extend([
-                    "Edit predicate name or arity",
-                    "Delete predicate (Erasure rule)",
-                    "Copy to broader context (Iteration rule)"
-                ])
-            elif element_id in graph.V:
-                suggestions.extend([
-                    "Connect to predicates",
-                    "Delete vertex (Erasure rule)",
-                    "Branch Line of Identity"
-                ])
-            elif element_id in graph.Cut:
-                suggestions.extend([
-                    "Delete cut contents",
-                    "Check for double cut deletion",
-                    "Insert elements inside cut"
-                ])
-        else:
-            suggestions.extend([
-                "Enclose selection with cut",
-                "Delete selected elements (Erasure rule)",
-                "Apply transformation rules to subgraph"
-            ])
+            return list(_EMPTY_SELECTION_SUGGESTIONS)
+        
+        if len(selected_elements) > 1:
+            return list(_MULTI_SELECTION_SUGGESTIONS)
+        
+        element_id = next(iter(selected_elements))
+        if element_id in graph._edge_map:
+            return list(_EDGE_SUGGESTIONS)
+        if element_id in graph._vertex_map:
+            return list(_VERTEX_SUGGESTIONS)
+        if element_id in graph._cut_map:
+            return list(_CUT_SUGGESTIONS)
         
-        return suggestions
+        return []
     
     def get_transformation_opportunities(self, graph: RelationalGraphWithCuts) -> List[Dict]:
         """Get available transformation opportunities for entire graph."""
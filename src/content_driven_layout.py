@@ -188,49 +188,6 @@ class ContentDrivenLayoutEngine:
         
         return vertex_primitives
     
-    def _build_cut_containment_hierarchy(self, graph: RelationalGraphWithCuts, cut_areas: List[ElementID]) -> List[List[ElementID]]:
-        """Build hierarchical levels of cuts based on their containment relationships."""
-        if not cut_areas:
-            return []
-        
-        # Build containment relationships from graph.area mapping
-        contains = {}  # parent_cut -> [child_cuts]
-        contained_by = {}  # child_cut -> parent_cut
-        
-        for cut_area in cut_areas:
-            contains[cut_area] = []
-            
-            # Find what this cut contains by looking at graph.area
-            if cut_area in graph.area:
-                contained_elements = graph.area[cut_area]
-                for elem_id in contained_elements:
-                    # Check if this element is another cut
-                    if elem_id in cut_areas:
-                        contains[cut_area].append(elem_id)
-                        contained_by[elem_id] = cut_area
-        
-        # Build levels from innermost (no children) to outermost (not contained by others)
-        levels = []
-        remaining_cuts = set(cut_areas)
-        
-        while remaining_cuts:
-            # Find cuts at current level (innermost remaining cuts - no children remaining)
-            current_level = []
-            for cut_id in list(remaining_cuts):
-                children = contains.get(cut_id, [])
-                # A cut is at current level if none of its children are still remaining
-                if all(child not in remaining_cuts for child in children):
-                    current_level.append(cut_id)
-            
-            if not current_level:
-                # Fallback: take all remaining cuts
-                current_level = list(remaining_cuts)
-            
-            levels.append(current_level)
-            remaining_cuts -= set(current_level)
-        
-        return levels
-    
     def _allocate_exclusive_cut_areas(self, graph: RelationalGraphWithCuts, cut_areas: List[ElementID]) -> Dict[ElementID, Tuple[float, float, float, float]]:
         """Allocate exclusive, non-overlapping areas for cuts to ensure proper EG logic.
         
@@ -239,10 +196,7 @@ class ContentDrivenLayoutEngine:
         if not cut_areas:
             return {}
         
-        # Build containment hierarchy
-        cut_hierarchy = self._build_cut_containment_hierarchy(graph, cut_areas)
-        
-        # Build parent-child relationships
+        # Build parent-child relationships in a single pass over the cut areas
         parent_of = {}  # child_cut -> parent_cut
         children_of = {}  # parent_cut -> [child_cuts]
         
@@ -563,24 +517,35 @@ class ContentDrivenLayoutEngine:
                     contained_by[child_group.area_id] = area_id
         
         # Build levels from innermost (no children) to outermost (not contained)
-        levels = []
-        remaining_cuts = set(cut_areas)
-        
-        while remaining_cuts:
-            # Find cuts at current level (innermost remaining cuts)
-            current_level = []
-            for cut_id in list(remaining_cuts):
-                # A cut is at current level if none of its children are still remaining
-                children = contains.get(cut_id, [])
-                if all(child not in remaining_cuts for child in children):
-                    current_level.append(cut_id)
-            
-            if not current_level:
-                # Fallback: just take remaining cuts
-                current_level = list(remaining_cuts)
-            
-            levels.append(current_level)
-            remaining_cuts -= set(current_level)
+        return self._group_cuts_into_levels(cut_areas, contains)
+    
+    def _group_cuts_into_levels(self, cut_areas: List[ElementID],
+                                contains: Dict[ElementID, List[ElementID]]) -> List[List[ElementID]]:
+        """Group cuts by height: level 0 holds innermost cuts, each parent sits above its deepest child."""
+        # Depth-first with an explicit stack: each cut's height is computed once
+        # and reused by every ancestor instead of re-scanning remaining cuts per level
+        heights = {}
+        seen = set()
+        
+        for root in cut_areas:
+            if root in heights:
+                continue
+            stack = [root]
+            while stack:
+                cut_id = stack[-1]
+                if cut_id not in seen:
+                    seen.add(cut_id)
+                    # Seen children are finished or still on the stack (a cycle); skip them
+                    stack.extend(child for child in contains.get(cut_id, []) if child not in seen)
+                    continue
+                stack.pop()
+                if cut_id not in heights:
+                    heights[cut_id] = 1 + max((heights.get(child, -1) for child in contains.get(cut_id, [])),
+                                              default=-1)
+        
+        levels = [[] for _ in range(max(heights.values(), default=-1) + 1)]
+        for cut_id in cut_areas:
+            levels[heights[cut_id]].append(cut_id)
         
         return levels
     
@@ -911,24 +876,15 @@ class ContentDrivenLayoutEngine:
     
     def _find_vertex_area(self, vertex_id: ElementID, graph: RelationalGraphWithCuts) -> ElementID:
         """Find which area contains this vertex."""
-        for area_id, elements in graph.area.items():
-            if vertex_id in elements:
-                return area_id
-        return graph.sheet  # Default to sheet if not found
+        return graph._context_map.get(vertex_id, graph.sheet)  # Default to sheet if not found
     
     def _find_edge_area(self, edge_id: ElementID, graph: RelationalGraphWithCuts) -> ElementID:
         """Find which area contains this edge."""
-        for area_id, elements in graph.area.items():
-            if edge_id in elements:
-                return area_id
-        return graph.sheet  # Default to sheet if not found
+        return graph._context_map.get(edge_id, graph.sheet)  # Default to sheet if not found
     
     def _find_parent_area(self, element_id: ElementID, graph: RelationalGraphWithCuts) -> Optional[ElementID]:
         """Find which area directly contains this element."""
-        for area_id, elements in graph.area.items():
-            if element_id in elements:
-                return area_id
-        return None
+        return graph._context_map.get(element_id)
     
     def _calculate_canvas_bounds(self, primitives: Dict[ElementID, SpatialPrimitive]) -> Bounds:
         """Calculate overall canvas bounds containing all primitives."""
@@ -951,7 +907,7 @@ class ContentDrivenLayoutEngine:
         """Build containment hierarchy for the graph."""
         hierarchy = {}
         for area_id, elements in graph.area.items():
-            hierarchy[area_id] = set(elements)
+            hierarchy[area_id] = elements
         return hierarchy
 
 
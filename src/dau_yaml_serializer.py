@@ -15,6 +15,12 @@ import time
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 
+# Use the libyaml C emitter/parser when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YAMLDumper, CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper, SafeLoader as _YAMLLoader
+
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -125,23 +131,11 @@ class DAUYAMLSerializer:
             }
         }
         
-        return yaml.dump(data, default_flow_style=False, sort_keys=False, indent=2)
+        return yaml.dump(data, Dumper=_YAMLDumper, default_flow_style=False, sort_keys=False, indent=2)
     
     def _count_isolated_vertices(self, graph: RelationalGraphWithCuts) -> int:
         """Count vertices with no incident edges (isolated vertices)."""
-        
-        # Get all vertices that appear in edge mappings
-        vertices_in_edges = set()
-        for vertex_sequence in graph.nu.values():
-            vertices_in_edges.update(vertex_sequence)
-        
-        # Count vertices not in any edge
-        isolated_count = 0
-        for vertex in graph.V:
-            if vertex.id not in vertices_in_edges:
-                isolated_count += 1
-        
-        return isolated_count
+        return len(graph.get_isolated_vertices())
 
 
 class DAUYAMLDeserializer:
@@ -164,7 +158,7 @@ class DAUYAMLDeserializer:
         """
         
         # Parse YAML
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=_YAMLLoader)
         
         if 'dau_relational_graph_with_cuts' not in data:
             raise ValueError("Invalid DAU YAML format: missing 'dau_relational_graph_with_cuts' key")
@@ -145,26 +145,20 @@ class DiagramLayout:
         
         # Build hierarchy recursively
         def add_cuts_to_parent(parent_id: str, parent_node: Dict[str, Any]):
-            # Find cuts that belong to this parent
-            child_cuts = []
-            for cut in graph.Cut:
-                # Check if this cut is directly contained in the parent
-                if parent_id in graph.area and cut.id in graph.area[parent_id]:
-                    child_cuts.append(cut)
-            
-            # Add each child cut to the parent node
-            for cut in child_cuts:
+            # Add each child cut to the parent node; direct children come from
+            # the graph's parent -> child cut index instead of a scan over all cuts
+            for cut_id in graph.get_child_cuts(parent_id):
                 # Calculate a size value for this cut (could be based on content)
                 cut_size = 100  # Default size - could be made smarter
                 
                 cut_node = {
-                    'id': cut.id,
+                    'id': cut_id,
                     'datum': cut_size,
                     'children': []
                 }
                 
                 # Recursively add cuts contained within this cut
-                add_cuts_to_parent(cut.id, cut_node)
+                add_cuts_to_parent(cut_id, cut_node)
                 
                 parent_node['children'].append(cut_node)
         
@@ -282,11 +276,7 @@ class DiagramLayout:
         depth = graph.get_nesting_depth(cut.id)
         
         # Find parent context
-        parent_context = None
-        for context_id, area_contents in graph.area.items():
-            if cut.id in area_contents:
-                parent_context = context_id
-                break
+        parent_context = graph._context_map.get(cut.id)
         
         if parent_context and parent_context in cut_bounds:
             # Nested cut - must be contained within parent bounds
@@ -494,11 +484,7 @@ class DiagramLayout:
         cuts_by_area = {}
         for cut in graph.Cut:
             # Find which area contains this cut
-            containing_area = None
-            for area_id, area_contents in graph.area.items():
-                if cut.id in area_contents:
-                    containing_area = area_id
-                    break
+            containing_area = graph._context_map.get(cut.id)
             
             if containing_area not in cuts_by_area:
                 cuts_by_area[containing_area] = []
@@ -935,19 +921,13 @@ class DiagramCanvas:
 
     def find_vertex_area(self, vertex_id: ElementID) -> ElementID:
         """Find which area (cut or sheet) contains a given vertex."""
-        for area_id, vertex_set in self.graph.area.items():
-            if vertex_id in vertex_set:
-                return area_id
         # If not found in any area, default to sheet
-        return self.graph.sheet
+        return self.graph._context_map.get(vertex_id, self.graph.sheet)
 
     def _find_parent_area(self, cut_id: ElementID) -> ElementID:
         """Find the parent area that contains the given cut."""
-        for area_id, area_contents in self.graph.area.items():
-            if cut_id in area_contents:
-                return area_id
         # If not found, default to sheet
-        return self.graph.sheet
+        return self.graph._context_map.get(cut_id, self.graph.sheet)
 
     def _find_elements_in_area(self, center: tuple[float, float], radius: float = 100) -> Dict[str, List[ElementID]]:
         """Find all elements (vertices, edges, cuts) within a circular area."""
@@ -1354,22 +1334,21 @@ class DiagramCanvas:
                 from egi_core_dau import create_edge
                 
                 # Find individuals (vertices) in the target area to attach the predicate to
-                individuals_in_area = []
-                for vertex in self.graph.V:
-                    vertex_area = self.find_vertex_area(vertex.id)
-                    if vertex_area == parent_area_id:
-                        individuals_in_area.append(vertex.id)
+                # Filter the area's own contents rather than locating every vertex;
+                # only the first individual is needed, so stop at the first match
+                first_individual = next((element_id for element_id in self.graph.get_area(parent_area_id)
+                                         if element_id in self.graph._vertex_map), None)
                 
-                if len(individuals_in_area) >= 1:
+                if first_individual is not None:
                     # Create a predicate that attaches to the first individual found
                     # In Dau's formalism, predicates have "hooks" that attach to line ends
                     new_edge = create_edge()
-                    vertex_tuple = (individuals_in_area[0],)  # Unary predicate
+                    vertex_tuple = (first_individual,)  # Unary predicate
                     relation_name = "P"  # Default predicate name - could be made configurable
                     self.graph = self.graph.with_edge(new_edge, vertex_tuple, relation_name, parent_area_id)
                     print(f"Added predicate '{new_edge.id}' ({relation_name}) with hook attached to individual {vertex_tuple[0]} in area '{parent_area_id}'")
                 else:
-                    print(f"Cannot create predicate: need at least 1 individual in area '{parent_area_id}', found {len(individuals_in_area)}")
+                    print(f"Cannot create predicate: need at least 1 individual in area '{parent_area_id}', found 0")
                     print("Note: In Dau's formalism, predicates attach to the ends of individual lines via 'hooks'")
 
             # Re-layout and redraw the canvas with the updated graph
@@ -5,7 +5,7 @@ Handles events, selection integration, and layer coordination.
 """
 
 from typing import Dict, List, Optional, Set, Callable, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import uuid
 
@@ -41,8 +41,8 @@ class DiagramState:
     interaction_mode: InteractionMode = InteractionMode.VIEW
     
     # Selection state
-    selected_elements: Set[ElementID] = None
-    highlighted_elements: Set[ElementID] = None
+    selected_elements: Set[ElementID] = field(default_factory=set)
+    highlighted_elements: Set[ElementID] = field(default_factory=set)
     
     # Interaction state
     drag_start: Optional[Coordinate] = None
@@ -52,12 +52,6 @@ class DiagramState:
     # Pending operations
     pending_element_type: Optional[str] = None
     pending_placement_mode: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.selected_elements is None:
-            object.__setattr__(self, 'selected_elements', set())
-        if self.highlighted_elements is None:
-            object.__setattr__(self, 'highlighted_elements', set())
 
 
 class DiagramController:
@@ -93,6 +87,7 @@ class DiagramController:
         
         # Performance optimization
         self._layout_cache: Dict[str, LayoutResult] = {}
+        self._graph_hash_memo: Optional[Tuple[RelationalGraphWithCuts, str]] = None
         self._needs_relayout = True
         self._needs_rerender = True
     
@@ -423,13 +418,20 @@ class DiagramController:
     
     def _hash_graph(self, graph: RelationalGraphWithCuts) -> str:
         """Create hash of graph for layout caching"""
+        # Graphs are immutable, so the hash of the last graph seen can be reused
+        memo = self._graph_hash_memo
+        if memo is not None and memo[0] is graph:
+            return memo[1]
+        
         # Simple hash based on element counts and structure
         vertex_count = len(graph.V)
         edge_count = len(graph.E)
         cut_count = len(graph.Cut)
         area_count = len(graph.area)
         
-        return f"{vertex_count}_{edge_count}_{cut_count}_{area_count}_{hash(str(graph.area))}"
+        graph_hash = f"{vertex_count}_{edge_count}_{cut_count}_{area_count}_{hash(str(graph.area))}"
+        self._graph_hash_memo = (graph, graph_hash)
+        return graph_hash
 
 
 # Factory functions for easy integration
@@ -190,6 +190,7 @@ class EnhancedDiagramController:
         self.current_layout: Optional[LayoutResult] = None
         self.change_history: List[Change] = []
         self.history_index = -1
+        self.max_history = 100  # Oldest changes (and the graphs/layouts they pin) are dropped
         
         # Clipboard for copy/paste
         self.clipboard: Optional[Dict[str, Any]] = None
@@ -526,10 +527,7 @@ class EnhancedDiagramController:
             timestamp=time.time()
         )
         
-        # Truncate history if we're not at the end
-        self.change_history = self.change_history[:self.history_index + 1]
-        self.change_history.append(change)
-        self.history_index = len(self.change_history) - 1
+        self._push_change(change)
     
     def _record_appearance_change(self, description: str, old_layout: LayoutResult,
                                  new_layout: LayoutResult) -> None:
@@ -544,8 +542,15 @@ class EnhancedDiagramController:
             timestamp=time.time()
         )
         
-        self.change_history = self.change_history[:self.history_index + 1]
+        self._push_change(change)
+    
+    def _push_change(self, change: Change) -> None:
+        """Append a change to the bounded undo/redo history."""
+        # Truncate history if we're not at the end
+        del self.change_history[self.history_index + 1:]
         self.change_history.append(change)
+        if len(self.change_history) > self.max_history:
+            del self.change_history[0]
         self.history_index = len(self.change_history) - 1
     
     def _render_diagram(self) -> None:
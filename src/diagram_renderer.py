@@ -5,7 +5,7 @@ Completely separated from layout and data concerns.
 """
 
 from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import math
 
@@ -44,8 +44,8 @@ class RenderingContext:
     theme: VisualTheme = VisualTheme.DAU_STANDARD
     
     # Selection state
-    selected_elements: Set[ElementID] = None
-    highlighted_elements: Set[ElementID] = None
+    selected_elements: Set[ElementID] = field(default_factory=set)
+    highlighted_elements: Set[ElementID] = field(default_factory=set)
     
     # Visual state
     show_debug_info: bool = False
@@ -54,12 +54,6 @@ class RenderingContext:
     
     # Animation state
     animation_progress: float = 0.0  # 0.0 to 1.0 for smooth transitions
-    
-    def __post_init__(self):
-        if self.selected_elements is None:
-            object.__setattr__(self, 'selected_elements', set())
-        if self.highlighted_elements is None:
-            object.__setattr__(self, 'highlighted_elements', set())
 
 
 class ElementRenderer:
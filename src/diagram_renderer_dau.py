@@ -83,39 +83,30 @@ class DiagramRendererDau:
         The nesting of curves must reflect the areaMap of the underlying EGI,
         ensuring that a cut's visual area correctly contains all its enclosed elements.
         """
-        # Process cuts in hierarchical order (outermost first)
-        cut_hierarchy = self._build_cut_hierarchy(graph)
+        # Styles are loop-invariant and only read by the canvas, so share them
+        cut_style = {
+            'color': self.conv.cut_color,
+            'width': self.conv.cut_line_width,  # FIXED: API mismatch
+            'fill_color': None  # No fill - just the curve
+        }
+        label_style = {
+            'color': (100, 100, 100),
+            'font_size': 8
+        }
         
         for cut in graph.Cut:
             if cut.id in layout_result.primitives:
                 cut_primitive = layout_result.primitives[cut.id]
                 
                 # Determine cut boundaries from layout
-                bounds = cut_primitive.bounds
-                center_x = (bounds[0] + bounds[2]) / 2
-                center_y = (bounds[1] + bounds[3]) / 2
-                width = bounds[2] - bounds[0]
-                height = bounds[3] - bounds[1]
+                x1, y1, x2, y2 = cut_primitive.bounds
+                center_x = (x1 + x2) / 2
                 
                 # Render as fine-drawn closed curve (oval)
-                canvas.draw_oval(
-                    bounds[0], bounds[1], bounds[2], bounds[3],
-                    {
-                        'color': self.conv.cut_color,
-                        'width': self.conv.cut_line_width,  # FIXED: API mismatch
-                        'fill_color': None  # No fill - just the curve
-                    }
-                )
+                canvas.draw_oval(x1, y1, x2, y2, cut_style)
                 
                 # Add cut label (optional, for debugging)
-                canvas.draw_text(
-                    f"Cut {cut.id[:6]}",
-                    (center_x, bounds[1] - 10),
-                    {
-                        'color': (100, 100, 100),
-                        'font_size': 8
-                    }
-                )
+                canvas.draw_text(f"Cut {cut.id[:6]}", (center_x, y1 - 10), label_style)
     
     def _render_ligatures_and_identity_lines(self, canvas: PySide6Canvas, 
                                            graph: RelationalGraphWithCuts,
@@ -125,6 +116,9 @@ class DiagramRendererDau:
         
         Must handle branches, junctions, and connections to predicates correctly.
         """
+        # Index edge incidences once instead of rescanning ν per vertex
+        incidences = self._build_vertex_incidences(graph)
+        
         # For each vertex, draw heavy lines to connected predicates
         for vertex_id, vertex in graph._vertex_map.items():
             if vertex_id not in layout_result.primitives:
@@ -134,7 +128,7 @@ class DiagramRendererDau:
             vertex_pos = vertex_primitive.position
             
             # Find all predicates connected to this vertex
-            connected_predicates = self._find_vertex_predicates(vertex_id, graph, layout_result)
+            connected_predicates = self._find_vertex_predicates(vertex_id, graph, layout_result, incidences)
             
             if connected_predicates:
                 # Draw heavy lines of identity to each predicate
@@ -152,6 +146,12 @@ class DiagramRendererDau:
         FIXED: Ensures predicate text never crosses cut boundaries and lines
         connect cleanly to predicate periphery per Dau's conventions.
         """
+        predicate_style = {
+            'color': self.conv.text_color,
+            'font_size': 12,
+            'bold': False
+        }
+        
         for edge_id, vertex_sequence in graph.nu.items():
             predicate_name = graph.rel.get(edge_id, edge_id)
             
@@ -167,15 +167,7 @@ class DiagramRendererDau:
             adjusted_position = self._ensure_predicate_within_area(edge_id, pred_bounds, graph, layout_result)
             
             # Render predicate name at adjusted position
-            canvas.draw_text(
-                predicate_name,
-                adjusted_position,
-                {
-                    'color': self.conv.text_color,
-                    'font_size': 12,
-                    'bold': False
-                }
-            )
+            canvas.draw_text(predicate_name, adjusted_position, predicate_style)
             
             # For multi-place predicates, add argument order labels
             if len(vertex_sequence) > 1:
@@ -197,6 +189,16 @@ class DiagramRendererDau:
         When a vertex is labeled with a constant name, display the name near
         the vertex spot or use the name in place of the spot for direct representation.
         """
+        spot_style = {
+            'color': self.conv.line_color,
+            'fill_color': self.conv.line_color
+        }
+        label_style = {
+            'color': self.conv.text_color,
+            'font_size': 10,
+            'bold': False
+        }
+        
         for vertex_id, vertex in graph._vertex_map.items():
             if vertex_id not in layout_result.primitives:
                 continue
@@ -205,67 +207,47 @@ class DiagramRendererDau:
             vertex_pos = vertex_primitive.position
             
             # Draw identity spot (small filled circle)
-            canvas.draw_circle(
-                vertex_pos,
-                self.conv.identity_spot_radius,
-                {
-                    'color': self.conv.line_color,
-                    'fill_color': self.conv.line_color
-                }
-            )
+            canvas.draw_circle(vertex_pos, self.conv.identity_spot_radius, spot_style)
             
             # Draw constant name if present
             if vertex.label:
                 # Position label below the spot to avoid line conflicts
                 label_pos = (vertex_pos[0], vertex_pos[1] + 20)
-                canvas.draw_text(
-                    f'"{vertex.label}"',
-                    label_pos,
-                    {
-                        'color': self.conv.text_color,
-                        'font_size': 10,
-                        'bold': False
-                    }
-                )
-    
-    def _build_cut_hierarchy(self, graph: RelationalGraphWithCuts) -> Dict[str, List[str]]:
-        """Build hierarchical structure of cuts for proper nesting."""
-        hierarchy = {}
-        
-        # Build parent -> children mapping
-        for cut in graph.Cut:
-            parent_area = self._find_cut_parent_area(cut.id, graph)
-            if parent_area not in hierarchy:
-                hierarchy[parent_area] = []
-            hierarchy[parent_area].append(cut.id)
-        
-        return hierarchy
+                canvas.draw_text(f'"{vertex.label}"', label_pos, label_style)
     
-    def _find_cut_parent_area(self, cut_id: str, graph: RelationalGraphWithCuts) -> str:
-        """Find the parent area that contains this cut."""
-        for area_id, contents in graph.area.items():
-            if cut_id in contents:
-                return area_id
-        return graph.sheet  # Default to sheet level
+    def _build_vertex_incidences(self, graph: RelationalGraphWithCuts) -> Dict[str, List[Tuple[str, Tuple[str, ...], int]]]:
+        """Map each vertex to (edge_id, vertex_sequence, first argument index) in ν order."""
+        incidences = {}
+        for edge_id, vertex_sequence in graph.nu.items():
+            seen = set()
+            for index, vertex_id in enumerate(vertex_sequence):
+                if vertex_id not in seen:
+                    seen.add(vertex_id)
+                    incidences.setdefault(vertex_id, []).append((edge_id, vertex_sequence, index))
+        return incidences
     
     def _find_vertex_predicates(self, vertex_id: str, graph: RelationalGraphWithCuts,
-                               layout_result: LayoutResult) -> List[Dict]:
+                               layout_result: LayoutResult,
+                               incidences: Optional[Dict[str, List[Tuple[str, Tuple[str, ...], int]]]] = None) -> List[Dict]:
         """Find all predicates connected to a vertex with their positions."""
+        if incidences is None:
+            incidences = self._build_vertex_incidences(graph)
+        
         connected = []
         
-        for edge_id, vertex_sequence in graph.nu.items():
-            if vertex_id in vertex_sequence:
-                predicate_name = graph.rel.get(edge_id, edge_id)
-                pred_position = self._find_predicate_position(edge_id, layout_result)
-                
-                if pred_position:
-                    connected.append({
-                        'edge_id': edge_id,
-                        'name': predicate_name,
-                        'position': pred_position,
-                        'vertex_sequence': vertex_sequence,
-                        'argument_index': vertex_sequence.index(vertex_id)
-                    })
+        for edge_id, vertex_sequence, argument_index in incidences.get(vertex_id, ()):
+            # Skip predicates that are not part of the layout before building anything
+            pred_position = self._find_predicate_position(edge_id, layout_result)
+            if not pred_position:
+                continue
+            
+            connected.append({
+                'edge_id': edge_id,
+                'name': graph.rel.get(edge_id, edge_id),
+                'position': pred_position,
+                'vertex_sequence': vertex_sequence,
+                'argument_index': argument_index
+            })
         
         return connected
     
@@ -293,12 +275,11 @@ class DiagramRendererDau:
         text_height = char_height
         
         # Calculate bounds (x1, y1, x2, y2)
-        x1 = position[0] - text_width / 2
-        y1 = position[1] - text_height / 2
-        x2 = position[0] + text_width / 2
-        y2 = position[1] + text_height / 2
+        x, y = position
+        half_width = text_width / 2
+        half_height = text_height / 2
         
-        return (x1, y1, x2, y2)
+        return (x - half_width, y - half_height, x + half_width, y + half_height)
     
     def _ensure_predicate_within_area(self, edge_id: str, predicate_bounds: Tuple[float, float, float, float],
                                      graph: RelationalGraphWithCuts, layout_result: LayoutResult,
@@ -433,6 +414,12 @@ class DiagramRendererDau:
                                     vertex_sequence: List[str], graph: RelationalGraphWithCuts,
                                     layout_result: LayoutResult) -> None:
         """Render argument order numbers for multi-place predicates."""
+        label_style = {
+            'color': self.conv.text_color,
+            'font_size': 8,
+            'bold': True
+        }
+        
         for i, vertex_id in enumerate(vertex_sequence):
             if vertex_id in layout_result.primitives:
                 vertex_pos = layout_result.primitives[vertex_id].position
@@ -446,15 +433,7 @@ class DiagramRendererDau:
                            mid_y - self.conv.argument_label_offset)
                 
                 # Draw argument number
-                canvas.draw_text(
-                    str(i + 1),  # 1-indexed argument numbers
-                    label_pos,
-                    {
-                        'color': self.conv.text_color,
-                        'font_size': 8,
-                        'bold': True
-                    }
-                )
+                canvas.draw_text(str(i + 1), label_pos, label_style)  # 1-indexed argument numbers
     
     def _render_predicate_hooks(self, canvas: PySide6Canvas, pred_position: Tuple[float, float],
                               vertex_sequence: List[str], graph: RelationalGraphWithCuts,
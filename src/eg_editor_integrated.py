@@ -18,6 +18,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Set, Dict, List, Optional, Tuple
 import json
+from collections import deque
 
 # Core EG components
 from egi_core_dau import RelationalGraphWithCuts, ElementID
@@ -60,7 +61,7 @@ class IntegratedEGEditor:
         self.current_graph: Optional[RelationalGraphWithCuts] = None
         self.current_file: Optional[str] = None
         self.selected_elements: Set[ElementID] = set()
-        self.undo_stack: List[RelationalGraphWithCuts] = []
+        self.undo_stack: deque = deque(maxlen=50)  # Oldest state drops off in O(1)
         self.redo_stack: List[RelationalGraphWithCuts] = []
         
         # UI components
@@ -819,10 +820,6 @@ class IntegratedEGEditor:
         if self.current_graph:
             self.undo_stack.append(self.current_graph)
             self.redo_stack.clear()
-            
-            # Limit undo stack size
-            if len(self.undo_stack) > 50:
-                self.undo_stack.pop(0)
     
     def _undo(self):
         """Undo last operation."""
@@ -12,9 +12,10 @@ These rules maintain syntactic validity and enable sound logical reasoning.
 """
 
 from typing import Set, Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import copy
+from frozendict import frozendict
 
 from egi_core_dau import (
     RelationalGraphWithCuts, Vertex, Edge, Cut, ElementID,
@@ -41,11 +42,7 @@ class TransformationResult:
     rule_applied: TransformationRule
     description: str
     error_message: Optional[str] = None
-    affected_elements: Set[ElementID] = None
-    
-    def __post_init__(self):
-        if self.affected_elements is None:
-            self.affected_elements = set()
+    affected_elements: Set[ElementID] = field(default_factory=set)
 
 
 @dataclass
@@ -316,9 +313,8 @@ class EGTransformationEngine:
                          elements_to_erase: Set[ElementID], **kwargs) -> ValidationResult:
         """Validate erasure (deletion from broader context)."""
         
-        # Check if all elements exist
-        all_elements = graph.V | graph.E | graph.Cut
-        if not elements_to_erase.issubset(all_elements):
+        # Check if all elements exist (every element ID keys the context map)
+        if not set(elements_to_erase).issubset(graph._context_map.keys()):
             return ValidationResult(
                 is_valid=False,
                 rule=TransformationRule.ERASURE,
@@ -336,24 +332,25 @@ class EGTransformationEngine:
                       elements_to_erase: Set[ElementID], **kwargs) -> TransformationResult:
         """Apply erasure: remove elements from graph."""
         
-        # Remove elements from sets
-        new_V = graph.V - elements_to_erase
-        new_E = graph.E - elements_to_erase
-        new_Cut = graph.Cut - elements_to_erase
+        # Remove elements from sets (the sets hold objects, so filter by ID)
+        erased = set(elements_to_erase)
+        new_V = frozenset(v for v_id, v in graph._vertex_map.items() if v_id not in erased)
+        new_E = frozenset(e for e_id, e in graph._edge_map.items() if e_id not in erased)
+        new_Cut = frozenset(c for c_id, c in graph._cut_map.items() if c_id not in erased)
         
         # Update mappings
-        new_rel = {k: v for k, v in graph.rel.items() if k not in elements_to_erase}
-        new_nu = {k: v for k, v in graph.nu.items() if k not in elements_to_erase}
+        new_rel = {k: v for k, v in graph.rel.items() if k not in erased}
+        new_nu = {k: v for k, v in graph.nu.items() if k not in erased}
         
         # Update area mappings
         new_area = {}
         for area_id, elements in graph.area.items():
-            if area_id not in elements_to_erase:
-                new_area[area_id] = elements - elements_to_erase
+            if area_id not in erased:
+                new_area[area_id] = elements - erased
         
-        final_graph = graph._replace(
-            V=new_V, E=new_E, Cut=new_Cut,
-            rel=new_rel, nu=new_nu, area=new_area
+        final_graph = replace(
+            graph, V=new_V, E=new_E, Cut=new_Cut,
+            rel=frozendict(new_rel), nu=frozendict(new_nu), area=frozendict(new_area)
         )
         
         return TransformationResult(
@@ -468,11 +465,7 @@ class EGTransformationEngine:
         """Apply cut deletion: remove cut and move contents to parent area."""
         
         # Find parent area of the cut
-        parent_area = None
-        for area_id, elements in graph.area.items():
-            if cut_id in elements:
-                parent_area = area_id
-                break
+        parent_area = graph._context_map.get(cut_id)
         
         if parent_area is None:
             return TransformationResult(
@@ -520,6 +513,9 @@ class BackgroundValidator:
     def __init__(self, transformation_engine: EGTransformationEngine):
         self.transformation_engine = transformation_engine
         self.validation_cache = {}
+        # (graph, graph-wide transformations) for the last graph queried;
+        # graphs are immutable, so the same object always yields the same list
+        self._available_cache: Optional[Tuple[RelationalGraphWithCuts, List[Dict]]] = None
     
     def validate_graph_structure(self, graph: RelationalGraphWithCuts) -> Dict[str, any]:
         """Perform comprehensive validation of graph structure."""
@@ -534,7 +530,6 @@ class BackgroundValidator:
         # Check basic structural integrity
         self._check_area_consistency(graph, validation_results)
         self._check_nu_mapping_consistency(graph, validation_results)
-        self._check_cut_nesting(graph, validation_results)
         
         # Check for potential transformations
         self._suggest_transformations(graph, validation_results)
@@ -544,15 +539,12 @@ class BackgroundValidator:
     def _check_area_consistency(self, graph: RelationalGraphWithCuts, results: Dict):
         """Check that area mappings are consistent."""
         
-        # FIXED: Compare element IDs, not objects vs strings
-        all_element_ids = {elem.id for elem in (graph.V | graph.E | graph.Cut)}
+        # Compare element IDs via the derived maps; every element placed in
+        # some area is a key of the context map
+        all_element_ids = graph._vertex_map.keys() | graph._edge_map.keys() | graph._cut_map.keys()
         
         # Check that all elements are in some area
-        elements_in_areas = set()
-        for elements in graph.area.values():
-            elements_in_areas.update(elements)
-        
-        orphaned_elements = all_element_ids - elements_in_areas
+        orphaned_elements = all_element_ids - graph._context_map.keys()
         if orphaned_elements:
             results['errors'].append(f"Orphaned elements not in any area: {orphaned_elements}")
             results['is_valid'] = False
@@ -560,9 +552,9 @@ class BackgroundValidator:
     def _check_nu_mapping_consistency(self, graph: RelationalGraphWithCuts, results: Dict):
         """Check that nu mappings are consistent."""
         
-        # FIXED: Compare IDs consistently
-        edge_ids = {edge.id for edge in graph.E}
-        vertex_ids = {vertex.id for vertex in graph.V}
+        # Compare IDs against the derived maps rather than rebuilding id sets
+        edge_ids = graph._edge_map
+        vertex_ids = graph._vertex_map
         
         # Check that all edges in nu mapping exist
         for edge_id in graph.nu:
@@ -577,48 +569,14 @@ class BackgroundValidator:
                     results['errors'].append(f"Nu mapping references non-existent vertex: {vertex_id}")
                     results['is_valid'] = False
     
-    def _check_cut_nesting(self, graph: RelationalGraphWithCuts, results: Dict):
-        """Check that cut nesting is proper (no cycles)."""
-        
-        # Build containment graph
-        containment = {}
-        for area_id, elements in graph.area.items():
-            if area_id in graph.Cut:
-                containment[area_id] = [eid for eid in elements if eid in graph.Cut]
-        
-        # Check for cycles (simplified)
-        visited = set()
-        
-        def has_cycle(cut_id, path):
-            if cut_id in path:
-                return True
-            if cut_id in visited:
-                return False
-            
-            visited.add(cut_id)
-            path.add(cut_id)
-            
-            for child_cut in containment.get(cut_id, []):
-                if has_cycle(child_cut, path):
-                    return True
-            
-            path.remove(cut_id)
-            return False
-        
-        for cut_id in graph.Cut:
-            if has_cycle(cut_id, set()):
-                results['errors'].append(f"Circular cut containment detected involving cut: {cut_id}")
-                results['is_valid'] = False
-    
     def _suggest_transformations(self, graph: RelationalGraphWithCuts, results: Dict):
         """Suggest possible valid transformations."""
         
-        # Look for double cuts that can be deleted
-        for cut_id in graph.Cut:
-            validation = self.transformation_engine.validate_transformation(
-                graph, TransformationRule.DOUBLE_CUT_DELETE, outer_cut_id=cut_id
-            )
-            if validation.is_valid:
+        # Look for double cuts that can be deleted, reusing the graph-wide
+        # entries so a later get_available_transformations needs no new pass
+        for entry in self._graph_transformations(graph):
+            if entry['rule'] == TransformationRule.DOUBLE_CUT_DELETE:
+                cut_id = entry['parameters']['outer_cut_id']
                 results['suggestions'].append(f"Can apply double cut deletion to cut {cut_id}")
         
         # Look for empty areas where double cuts can be inserted
@@ -630,39 +588,52 @@ class BackgroundValidator:
                                     context_elements: Set[ElementID] = None) -> List[Dict]:
         """Get list of available transformations for current context."""
         
-        available = []
+        # Every feedback message re-queries the same graph; only the
+        # selection-dependent erasure entry needs rebuilding per call.
+        # Callers get copies so they cannot alter the cached entries.
+        available = [{**entry, 'parameters': dict(entry['parameters'])}
+                     for entry in self._graph_transformations(graph)]
         
-        # Check all transformation rules
-        for rule in TransformationRule:
-            if rule == TransformationRule.DOUBLE_CUT_INSERT:
-                # Can always insert double cut in any area
-                for area_id in graph.area:
-                    available.append({
-                        'rule': rule,
-                        'description': f"Insert double cut in area {area_id}",
-                        'parameters': {'target_area': area_id}
-                    })
-            
-            elif rule == TransformationRule.DOUBLE_CUT_DELETE:
-                # Check each cut for double cut deletion
-                for cut_id in graph.Cut:
-                    validation = self.transformation_engine.validate_transformation(
-                        graph, rule, outer_cut_id=cut_id
-                    )
-                    if validation.is_valid:
-                        available.append({
-                            'rule': rule,
-                            'description': f"Delete double cut {cut_id}",
-                            'parameters': {'outer_cut_id': cut_id}
-                        })
-            
-            elif rule == TransformationRule.ERASURE:
-                # Can erase any elements
-                if context_elements:
-                    available.append({
-                        'rule': rule,
-                        'description': f"Erase {len(context_elements)} selected elements",
-                        'parameters': {'elements_to_erase': context_elements}
-                    })
+        if context_elements:
+            # Can erase any elements
+            available.append({
+                'rule': TransformationRule.ERASURE,
+                'description': f"Erase {len(context_elements)} selected elements",
+                'parameters': {'elements_to_erase': context_elements}
+            })
+        
+        return available
+    
+    def _graph_transformations(self, graph: RelationalGraphWithCuts) -> List[Dict]:
+        """Return the graph-wide transformations, computed once per graph."""
+        cached = self._available_cache
+        if cached is None or cached[0] is not graph:
+            cached = (graph, self._find_graph_transformations(graph))
+            self._available_cache = cached
+        return cached[1]
+    
+    def _find_graph_transformations(self, graph: RelationalGraphWithCuts) -> List[Dict]:
+        """Find transformations that depend only on the graph, not the selection."""
+        
+        # Only the two double-cut rules depend on the graph alone, so build
+        # their entries directly instead of testing every rule in a loop
+        insert_rule = TransformationRule.DOUBLE_CUT_INSERT
+        delete_rule = TransformationRule.DOUBLE_CUT_DELETE
+        
+        # Can always insert double cut in any area
+        available = [{
+            'rule': insert_rule,
+            'description': f"Insert double cut in area {area_id}",
+            'parameters': {'target_area': area_id}
+        } for area_id in graph.area]
+        
+        # Check each cut for double cut deletion
+        validate = self.transformation_engine.validate_transformation
+        available.extend({
+            'rule': delete_rule,
+            'description': f"Delete double cut {cut_id}",
+            'parameters': {'outer_cut_id': cut_id}
+        } for cut_id in graph.Cut
+            if validate(graph, delete_rule, outer_cut_id=cut_id).is_valid)
         
         return available
@@ -14,8 +14,9 @@ Key Features:
 
 import json
 import jsonschema
-from typing import Dict, List, Any, Optional, Tuple, Union
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Union, get_args, get_origin
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
 from datetime import datetime
 import sys
 
@@ -33,6 +34,14 @@ except ImportError:
     YAML_AVAILABLE = False
     yaml = None
 
+# Fast JSON export with fallback to the standard library encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Use proper API contracts and current EGI implementation
 from egi_core_dau import RelationalGraphWithCuts, create_empty_graph, Vertex, Edge, Cut
 from egif_parser_dau import EGIFParser
@@ -152,6 +161,50 @@ class EGDFDocument:
     version: str = "1.0.0"
     export_settings: Optional[Dict[str, Any]] = None
 
+# Default visual layout settings, flattened once and copied per document
+_DEFAULT_CANVAS_TEMPLATE = asdict(CanvasSettings(width=800, height=600))
+_DEFAULT_STYLE_THEME_TEMPLATE = asdict(StyleTheme())
+
+# Leaf types that _convert_tuples_to_lists passes through unchanged
+_YAML_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+def _copy_container(value):
+    """Copy a list/dict value so the document does not alias the primitive."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+def _intern(value):
+    """Intern a string ID or relation name; other values pass through unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+def _is_container_type(field_type) -> bool:
+    """Check if a field annotation is (an Optional of) a list or dict type."""
+    origin = get_origin(field_type)
+    if origin is Union:
+        return any(_is_container_type(arg) for arg in get_args(field_type))
+    return field_type in (list, dict) or origin in (list, dict)
+
+@lru_cache(maxsize=None)
+def _compile_to_dict(cls):
+    """Generate a straight-line to-dict function for a dataclass type, once per class."""
+    entries = []
+    for f in fields(cls):
+        if _is_container_type(f.type):
+            entries.append(f"{f.name!r}: _copy_container(obj.{f.name})")
+        else:
+            entries.append(f"{f.name!r}: obj.{f.name}")
+    source = "def to_dict(obj):\n    return {" + ", ".join(entries) + "}\n"
+    namespace = {"_copy_container": _copy_container}
+    exec(source, namespace)
+    return namespace["to_dict"]
+
+def _primitive_to_dict(primitive: SpatialPrimitive) -> Dict[str, Any]:
+    """Convert a spatial primitive to a dict (same result as asdict, without its deep copy)."""
+    return _compile_to_dict(type(primitive))(primitive)
+
 class EGDFParser:
     """Parser for EGDF format with validation and round-trip support."""
     
@@ -159,6 +212,13 @@ class EGDFParser:
         # EGIFParser will be initialized when needed with actual text
         self.egif_parser = None
         self._schema = self._create_egdf_schema()
+        
+        # Per-type converters for _convert_tuples_to_lists, bound once
+        self._yaml_converters = {
+            tuple: list,
+            dict: lambda obj: {key: self._convert_tuples_to_lists(value) for key, value in obj.items()},
+            list: lambda obj: [self._convert_tuples_to_lists(item) for item in obj],
+        }
     
     def _create_egdf_schema(self) -> Dict[str, Any]:
         """Create JSON schema for EGDF validation."""
@@ -253,35 +313,33 @@ class EGDFParser:
         """Serialize EGI to dictionary format for EGDF storage."""
         try:
             # Serialize vertices
-            vertices = []
-            for vertex in egi.V:
-                vertices.append({
+            vertices = [
+                {
                     "id": vertex.id,
                     "label": vertex.label,
                     "is_generic": vertex.is_generic
-                })
+                }
+                for vertex in egi.V
+            ]
             
             # Serialize edges
-            edges = []
-            for edge in egi.E:
-                edge_data = {
+            edges = [
+                {
                     "id": edge.id,
                     "relation_name": egi.rel.get(edge.id, ""),
                     "incident_vertices": list(egi.nu.get(edge.id, ()))
                 }
-                edges.append(edge_data)
+                for edge in egi.E
+            ]
             
             # Serialize cuts
-            cuts = []
-            for cut in egi.Cut:
-                cuts.append({
-                    "id": cut.id
-                })
+            cuts = [{"id": cut.id} for cut in egi.Cut]
             
             # Serialize area mapping
-            area_mapping = {}
-            for context_id, elements in egi.area.items():
-                area_mapping[context_id] = list(elements)
+            area_mapping = {
+                context_id: list(elements)
+                for context_id, elements in egi.area.items()
+            }
             
             return {
                 "vertices": vertices,
@@ -301,46 +359,41 @@ class EGDFParser:
         try:
             from frozendict import frozendict
             
-            # Reconstruct vertices
-            vertices = set()
-            for v_data in egi_data.get("vertices", []):
-                vertex = Vertex(
-                    id=v_data["id"],
-                    label=v_data.get("label"),
-                    is_generic=v_data.get("is_generic", True)
-                )
-                vertices.add(vertex)
-            
-            # Reconstruct edges
-            edges = set()
-            for e_data in egi_data.get("edges", []):
-                edge = Edge(id=e_data["id"])
-                edges.add(edge)
-            
-            # Reconstruct cuts
-            cuts = set()
-            for c_data in egi_data.get("cuts", []):
-                cut = Cut(id=c_data["id"])
-                cuts.add(cut)
+            # Element IDs and relation names repeat across the vertex/edge/cut
+            # lists and the ν/area/rel mappings; intern them so each is shared
+            intern = _intern
+            
+            # Reconstruct vertices, edges and cuts (positional construction)
+            vertices = frozenset([
+                Vertex(intern(v_data["id"]), v_data.get("label"), v_data.get("is_generic", True))
+                for v_data in egi_data.get("vertices", [])
+            ])
+            edges = frozenset([Edge(intern(e_data["id"])) for e_data in egi_data.get("edges", [])])
+            cuts = frozenset([Cut(intern(c_data["id"])) for c_data in egi_data.get("cuts", [])])
             
             # Reconstruct mappings
-            nu_mapping = {}
-            for edge_id, vertex_seq in egi_data.get("nu_mapping", {}).items():
-                nu_mapping[edge_id] = tuple(vertex_seq)
+            nu_mapping = {
+                intern(edge_id): tuple(map(intern, vertex_seq))
+                for edge_id, vertex_seq in egi_data.get("nu_mapping", {}).items()
+            }
             
-            area_mapping = {}
-            for context_id, elements in egi_data.get("area_mapping", {}).items():
-                area_mapping[context_id] = frozenset(elements)
+            area_mapping = {
+                intern(context_id): frozenset(map(intern, elements))
+                for context_id, elements in egi_data.get("area_mapping", {}).items()
+            }
             
-            rel_mapping = egi_data.get("rel_mapping", {})
+            rel_mapping = {
+                intern(edge_id): intern(relation_name)
+                for edge_id, relation_name in egi_data.get("rel_mapping", {}).items()
+            }
             
             # Create RelationalGraphWithCuts
             egi = RelationalGraphWithCuts(
-                V=frozenset(vertices),
-                E=frozenset(edges),
+                V=vertices,
+                E=edges,
                 nu=frozendict(nu_mapping),
-                sheet=egi_data.get("sheet", "sheet"),
-                Cut=frozenset(cuts),
+                sheet=intern(egi_data.get("sheet", "sheet")),
+                Cut=cuts,
                 area=frozendict(area_mapping),
                 rel=frozendict(rel_mapping)
             )
@@ -509,19 +562,13 @@ class EGDFParser:
         # Serialize EGI using our new method
         canonical_egi = self._serialize_egi_to_dict(egi)
         
-        # Create visual layout
-        canvas = CanvasSettings(width=800, height=600)
-        style_theme = StyleTheme()
-        
         # Convert spatial primitives to dict format
-        spatial_primitives_data = []
-        for primitive in layout_primitives:
-            primitive_dict = asdict(primitive)
-            spatial_primitives_data.append(primitive_dict)
+        spatial_primitives_data = [_primitive_to_dict(primitive) for primitive in layout_primitives]
         
+        # Create visual layout from the default canvas/style templates
         visual_layout = {
-            "canvas": asdict(canvas),
-            "style_theme": asdict(style_theme),
+            "canvas": _DEFAULT_CANVAS_TEMPLATE.copy(),
+            "style_theme": _DEFAULT_STYLE_THEME_TEMPLATE.copy(),
             "spatial_primitives": spatial_primitives_data
         }
         
@@ -538,10 +585,25 @@ class EGDFParser:
     
     def egdf_to_json(self, egdf_doc: EGDFDocument, indent: int = 2) -> str:
         """Convert EGDFDocument to JSON string."""
+        # orjson only supports 2-space indentation (or none)
+        if ORJSON_AVAILABLE and indent in (None, 2):
+            option = orjson.OPT_NON_STR_KEYS
+            if indent == 2:
+                option |= orjson.OPT_INDENT_2
+            # orjson encodes dataclasses natively - no intermediate asdict() tree
+            return orjson.dumps(egdf_doc, default=str, option=option).decode('utf-8')
+        
         return json.dumps(asdict(egdf_doc), indent=indent, default=str)
     
     def _convert_tuples_to_lists(self, obj):
         """Recursively convert tuples to lists for YAML compatibility."""
+        converter = self._yaml_converters.get(type(obj))
+        if converter is not None:
+            return converter(obj)
+        if type(obj) in _YAML_SCALAR_TYPES:
+            return obj
+        
+        # Subclasses of the container types take the general path
         if isinstance(obj, tuple):
             return list(obj)
         elif isinstance(obj, dict):
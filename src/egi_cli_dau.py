@@ -12,6 +12,7 @@ Key features:
 
 import argparse
 import sys
+from collections import deque
 from typing import Optional, Dict, List, Set
 try:
     # Try relative imports first (when used as module)
@@ -46,8 +47,9 @@ class EGICLIApplication:
     
     def __init__(self):
         self.current_graph: Optional[RelationalGraphWithCuts] = None
-        self.history: List[RelationalGraphWithCuts] = []
         self.max_history = 50
+        # Bounded deque drops the oldest entry in O(1) once full
+        self.history: deque = deque(maxlen=self.max_history)
     
     def run_interactive(self):
         """Run interactive CLI mode."""
@@ -410,8 +412,6 @@ Examples:
         """Save current graph to history."""
         if self.current_graph:
             self.history.append(self.current_graph)
-            if len(self.history) > self.max_history:
-                self.history.pop(0)
     
     def _undo(self):
         """Undo last transformation."""
@@ -430,7 +430,7 @@ Examples:
             return
         
         print(f"History ({len(self.history)} entries):")
-        for i, graph in enumerate(self.history[-5:], 1):  # Show last 5
+        for i, graph in enumerate(list(self.history)[-5:], 1):  # Show last 5
             egif = generate_egif(graph)
             print(f"  {i}. {egif}")
     
@@ -9,9 +9,10 @@ This implementation replaces the previous "Context" model with Dau's formal:
 - Support for isolated vertices ("heavy dots")
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import FrozenSet, Dict, Set, List, Optional, Tuple, Union, Any
 from frozendict import frozendict
+from collections import deque
 import uuid
 from abc import ABC, abstractmethod
 
@@ -39,14 +40,24 @@ class Vertex:
 @dataclass(frozen=True)
 class Edge:
     """Edge in Dau's formalism - represents a relation with incident vertices."""
+    __slots__ = ('id',)
     id: ElementID
     # Note: ν mapping and relation names are handled separately in the main structure
+    
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored attribute-by-attribute
+        return (Edge, (self.id,))
 
 
 @dataclass(frozen=True)
 class Cut:
     """Cut in Dau's formalism - represents negation context."""
+    __slots__ = ('id',)
     id: ElementID
+    
+    def __reduce__(self):
+        # Frozen slotted instances cannot be restored attribute-by-attribute
+        return (Cut, (self.id,))
 
 
 @dataclass(frozen=True)
@@ -84,6 +95,18 @@ class RelationalGraphWithCuts:
     _vertex_map: frozendict[ElementID, Vertex] = None
     _edge_map: frozendict[ElementID, Edge] = None
     _cut_map: frozendict[ElementID, Cut] = None
+    _context_map: frozendict[ElementID, ElementID] = None
+    _child_cut_map: frozendict[ElementID, FrozenSet[ElementID]] = None
+    _incident_edge_map: frozendict[ElementID, FrozenSet[ElementID]] = None
+    
+    # Lazily cached EGIF text (the graph is immutable, so it never goes stale)
+    _egif_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Memoized get_full_context results, keyed by context
+    _full_context_cache: Dict[ElementID, FrozenSet[ElementID]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # Memoized nesting depths (parity gives polarity), keyed by element
+    _depth_cache: Dict[ElementID, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate Dau's formal constraints and build derived mappings."""
@@ -91,10 +114,23 @@ class RelationalGraphWithCuts:
         vertex_map = {v.id: v for v in self.V}
         edge_map = {e.id: e for e in self.E}
         cut_map = {c.id: c for c in self.Cut}
+        context_map = {element_id: context_id
+                       for context_id, area_elements in self.area.items()
+                       for element_id in area_elements}
+        child_cut_map = {context_id: frozenset(cut_map.keys() & area_elements)
+                         for context_id, area_elements in self.area.items()}
+        incident_edge_map = {}
+        for edge_id, vertex_seq in self.nu.items():
+            for vertex_id in vertex_seq:
+                incident_edge_map.setdefault(vertex_id, set()).add(edge_id)
         
         object.__setattr__(self, '_vertex_map', frozendict(vertex_map))
         object.__setattr__(self, '_edge_map', frozendict(edge_map))
         object.__setattr__(self, '_cut_map', frozendict(cut_map))
+        object.__setattr__(self, '_context_map', frozendict(context_map))
+        object.__setattr__(self, '_child_cut_map', frozendict(child_cut_map))
+        object.__setattr__(self, '_incident_edge_map', frozendict(
+            {vertex_id: frozenset(edge_ids) for vertex_id, edge_ids in incident_edge_map.items()}))
         
         # Validate Dau's constraints
         self._validate_dau_constraints()
@@ -102,10 +138,11 @@ class RelationalGraphWithCuts:
     def _validate_dau_constraints(self):
         """Validate all constraints from Dau's Definition 12.1."""
         
-        # Constraint: V, E, Cut are pairwise disjoint
-        v_ids = {v.id for v in self.V}
-        e_ids = {e.id for e in self.E}
-        c_ids = {c.id for c in self.Cut}
+        # Constraint: V, E, Cut are pairwise disjoint (id sets come from the
+        # derived maps built just before validation)
+        v_ids = self._vertex_map.keys()
+        e_ids = self._edge_map.keys()
+        c_ids = self._cut_map.keys()
         
         if v_ids & e_ids:
             raise ValueError("V and E must be disjoint")
@@ -127,37 +164,31 @@ class RelationalGraphWithCuts:
                 if vertex_id not in v_ids:
                     raise ValueError(f"ν maps edge {edge_id} to non-vertex {vertex_id}")
         
-        # All edges must have ν mapping
+        # All edges must have ν mapping, and rel must map them to relation names
         for edge_id in e_ids:
             if edge_id not in self.nu:
                 raise ValueError(f"Edge {edge_id} missing ν mapping")
-        
-        # Constraint: rel maps edges to relation names
-        for edge_id in e_ids:
             if edge_id not in self.rel:
                 raise ValueError(f"Edge {edge_id} missing relation name mapping")
         
         # Constraint: area mapping constraints
-        self._validate_area_constraints()
+        self._validate_area_constraints(all_element_ids)
     
-    def _validate_area_constraints(self):
+    def _validate_area_constraints(self, all_elements: Set[ElementID]):
         """Validate area mapping constraints from Definition 12.1."""
-        all_contexts = set(self.Cut) | {self.sheet}
-        all_elements = {v.id for v in self.V} | {e.id for e in self.E} | {c.id for c in self.Cut}
-        
         # Constraint a) c₁ ≠ c₂ ⇒ area(c₁) ∩ area(c₂) = ∅
+        # Recording each element's owning context finds any overlap in one
+        # pass instead of intersecting every pair of areas
         context_ids = [c.id for c in self.Cut] + [self.sheet]
-        for i, c1 in enumerate(context_ids):
-            for c2 in context_ids[i+1:]:
-                area1 = self.area.get(c1, frozenset())
-                area2 = self.area.get(c2, frozenset())
-                if area1 & area2:
-                    raise ValueError(f"Areas of {c1} and {c2} must be disjoint")
+        owner = {}
+        for context_id in context_ids:
+            for element_id in self.area.get(context_id, frozenset()):
+                other = owner.setdefault(element_id, context_id)
+                if other != context_id:
+                    raise ValueError(f"Areas of {other} and {context_id} must be disjoint")
         
         # Constraint b) V ∪ E ∪ Cut = ⋃ area(d)
-        all_in_areas = set()
-        for context_id in context_ids:
-            all_in_areas |= self.area.get(context_id, frozenset())
+        all_in_areas = set(owner)
         
         if all_elements != all_in_areas:
             missing = all_elements - all_in_areas
@@ -170,21 +201,21 @@ class RelationalGraphWithCuts:
             if self._has_area_cycle(context_id):
                 raise ValueError(f"Context {context_id} has area containment cycle")
     
-    def _has_area_cycle(self, start_context: ElementID, visited: Optional[Set[ElementID]] = None) -> bool:
+    def _has_area_cycle(self, start_context: ElementID) -> bool:
         """Check if context has cycle in area containment."""
-        if visited is None:
-            visited = set()
-        
-        if start_context in visited:
-            return True
-        
-        visited.add(start_context)
-        
-        # Check all cuts in this context's area
-        for element_id in self.area.get(start_context, frozenset()):
-            if element_id in self._cut_map:
-                if self._has_area_cycle(element_id, visited.copy()):
+        # Areas are already known to be disjoint, so every cut has at most one
+        # parent: reaching a context twice from start_context means a cycle.
+        visited = {start_context}
+        queue = deque([start_context])
+        
+        while queue:
+            current = queue.popleft()
+            # Check all cuts in this context's area
+            for cut_id in self._child_cut_map.get(current, frozenset()):
+                if cut_id in visited:
                     return True
+                visited.add(cut_id)
+                queue.append(cut_id)
         
         return False
     
@@ -226,11 +257,14 @@ class RelationalGraphWithCuts:
         """Get area of context - direct contents only (non-recursive)."""
         return self.area.get(context_id, frozenset())
     
+    def get_child_cuts(self, context_id: ElementID) -> FrozenSet[ElementID]:
+        """Get cuts directly contained in the area of a context."""
+        return self._child_cut_map.get(context_id, frozenset())
+    
     def get_context(self, element_id: ElementID) -> ElementID:
         """Get the context that directly contains this element."""
-        for context_id, area_elements in self.area.items():
-            if element_id in area_elements:
-                return context_id
+        if element_id in self._context_map:
+            return self._context_map[element_id]
         raise ValueError(f"Element {element_id} not found in any context")
     
     def get_full_context(self, context_id: ElementID) -> FrozenSet[ElementID]:
@@ -238,40 +272,51 @@ class RelationalGraphWithCuts:
         Get full context of a cut - all elements it contributes to SoA (recursive).
         This is Dau's context concept: ⋃ area^n(c) for all n.
         """
-        result = set()
-        to_process = {context_id}
+        cached = self._full_context_cache.get(context_id)
+        if cached is not None:
+            return cached
+        
+        # Areas are validated to be disjoint and acyclic, so the cuts form a
+        # tree: each area is reached exactly once and needs no visited check
+        result = []
+        to_process = [context_id]
         
         while to_process:
             current = to_process.pop()
-            current_area = self.area.get(current, frozenset())
-            
-            for element_id in current_area:
-                if element_id not in result:
-                    result.add(element_id)
-                    # If element is a cut, add its area to processing
-                    if element_id in self._cut_map:
-                        to_process.add(element_id)
+            result.extend(self.area.get(current, frozenset()))
+            to_process.extend(self._child_cut_map.get(current, frozenset()))
         
-        return frozenset(result)
+        full_context = frozenset(result)
+        self._full_context_cache[context_id] = full_context
+        return full_context
     
     def get_nesting_depth(self, element_id: ElementID) -> int:
         """Get nesting depth of element (number of cuts enclosing it)."""
-        depth = 0
+        depth_cache = self._depth_cache
+        if element_id in depth_cache:
+            return depth_cache[element_id]
+        
+        # Walk up until the sheet or an ancestor whose depth is already known
+        chain = [element_id]
         current_context = self.get_context(element_id)
+        while current_context != self.sheet and current_context not in depth_cache:
+            chain.append(current_context)
+            current_context = self.get_context(current_context)
         
-        while current_context != self.sheet:
+        depth = 0 if current_context == self.sheet else depth_cache[current_context] + 1
+        for ancestor in reversed(chain):
+            depth_cache[ancestor] = depth
             depth += 1
-            current_context = self.get_context(current_context)
         
-        return depth
+        return depth_cache[element_id]
     
     def is_evenly_enclosed(self, element_id: ElementID) -> bool:
         """Check if element is evenly enclosed (Dau's Definition 12.4)."""
-        return self.get_nesting_depth(element_id) % 2 == 0
+        return not self.get_nesting_depth(element_id) & 1
     
     def is_oddly_enclosed(self, element_id: ElementID) -> bool:
         """Check if element is oddly enclosed (Dau's Definition 12.4)."""
-        return self.get_nesting_depth(element_id) % 2 == 1
+        return bool(self.get_nesting_depth(element_id) & 1)
     
     def is_positive_context(self, context_id: ElementID) -> bool:
         """Check if context is positive (sheet or oddly enclosed cut)."""
@@ -285,20 +330,17 @@ class RelationalGraphWithCuts:
     
     # Utility methods
     
+    def get_incident_edges(self, vertex_id: ElementID) -> FrozenSet[ElementID]:
+        """Get edges whose ν sequence contains the vertex."""
+        return self._incident_edge_map.get(vertex_id, frozenset())
+    
     def is_vertex_isolated(self, vertex_id: ElementID) -> bool:
         """Check if vertex is isolated (not incident to any edge)."""
-        for edge_id, vertex_seq in self.nu.items():
-            if vertex_id in vertex_seq:
-                return False
-        return True
+        return vertex_id not in self._incident_edge_map
     
     def get_isolated_vertices(self) -> FrozenSet[ElementID]:
         """Get all isolated vertices."""
-        isolated = set()
-        for vertex in self.V:
-            if self.is_vertex_isolated(vertex.id):
-                isolated.add(vertex.id)
-        return frozenset(isolated)
+        return frozenset(self._vertex_map.keys() - self._incident_edge_map.keys())
     
     def has_dominating_nodes(self) -> bool:
         """Check if graph has dominating nodes (Dau's Definition 12.5)."""
@@ -313,17 +355,19 @@ class RelationalGraphWithCuts:
     
     def _context_dominates(self, context1: ElementID, context2: ElementID) -> bool:
         """Check if context1 ≤ context2 in Dau's ordering."""
-        if context1 == context2:
+        # The sheet is an ancestor of every context - no walk needed
+        if context1 == context2 or context1 == self.sheet:
             return True
         
-        # Check if context1 is in area^n(context2) for some n
+        # Check if context1 is in area^n(context2) for some n; the equality
+        # and sheet cases are settled above, so walk straight to the parents
         current = context2
         while current != self.sheet:
-            if context1 == current:
-                return True
             current = self.get_context(current)
+            if current == context1:
+                return True
         
-        return context1 == self.sheet
+        return False
     
     # Creation methods
     
@@ -345,15 +389,7 @@ class RelationalGraphWithCuts:
         context_area = new_area.get(context_id, frozenset())
         new_area[context_id] = context_area | {vertex.id}
         
-        return RelationalGraphWithCuts(
-            V=new_V,
-            E=self.E,
-            nu=self.nu,
-            sheet=self.sheet,
-            Cut=self.Cut,
-            area=frozendict(new_area),
-            rel=self.rel
-        )
+        return replace(self, V=new_V, area=frozendict(new_area))
     
     def with_edge(self, edge: Edge, vertex_sequence: VertexSequence, 
                   relation_name: RelationName, context_id: ElementID = None) -> 'RelationalGraphWithCuts':
@@ -378,15 +414,8 @@ class RelationalGraphWithCuts:
         context_area = new_area.get(context_id, frozenset())
         new_area[context_id] = context_area | {edge.id}
         
-        return RelationalGraphWithCuts(
-            V=self.V,
-            E=new_E,
-            nu=frozendict(new_nu),
-            sheet=self.sheet,
-            Cut=self.Cut,
-            area=frozendict(new_area),
-            rel=frozendict(new_rel)
-        )
+        return replace(self, E=new_E, nu=frozendict(new_nu),
+                       area=frozendict(new_area), rel=frozendict(new_rel))
     
     def with_cut(self, cut: Cut, context_id: ElementID = None) -> 'RelationalGraphWithCuts':
         """Create new graph with additional cut."""
@@ -404,15 +433,7 @@ class RelationalGraphWithCuts:
         # Initialize empty area for new cut
         new_area[cut.id] = frozenset()
         
-        return RelationalGraphWithCuts(
-            V=self.V,
-            E=self.E,
-            nu=self.nu,
-            sheet=self.sheet,
-            Cut=new_Cut,
-            area=frozendict(new_area),
-            rel=self.rel
-        )
+        return replace(self, Cut=new_Cut, area=frozendict(new_area))
     
     def without_element(self, element_id: ElementID) -> 'RelationalGraphWithCuts':
         """Create new graph without specified element."""
@@ -435,15 +456,7 @@ class RelationalGraphWithCuts:
             if vertex_id in area_elements:
                 new_area[context_id] = area_elements - {vertex_id}
         
-        return RelationalGraphWithCuts(
-            V=new_V,
-            E=self.E,
-            nu=self.nu,
-            sheet=self.sheet,
-            Cut=self.Cut,
-            area=frozendict(new_area),
-            rel=self.rel
-        )
+        return replace(self, V=new_V, area=frozendict(new_area))
     
     def _without_edge(self, edge_id: ElementID) -> 'RelationalGraphWithCuts':
         """Remove edge and update mappings."""
@@ -457,15 +470,7 @@ class RelationalGraphWithCuts:
             if edge_id in area_elements:
                 new_area[context_id] = area_elements - {edge_id}
         
-        return RelationalGraphWithCuts(
-            V=self.V,
-            E=new_E,
-            nu=new_nu,
-            sheet=self.sheet,
-            Cut=self.Cut,
-            area=frozendict(new_area),
-            rel=new_rel
-        )
+        return replace(self, E=new_E, nu=new_nu, area=frozendict(new_area), rel=new_rel)
     
     def _without_cut(self, cut_id: ElementID) -> 'RelationalGraphWithCuts':
         """Remove cut and redistribute its contents."""
@@ -486,15 +491,7 @@ class RelationalGraphWithCuts:
         # Remove cut's area mapping
         del new_area[cut_id]
         
-        return RelationalGraphWithCuts(
-            V=self.V,
-            E=self.E,
-            nu=self.nu,
-            sheet=self.sheet,
-            Cut=new_Cut,
-            area=frozendict(new_area),
-            rel=self.rel
-        )
+        return replace(self, Cut=new_Cut, area=frozendict(new_area))
 
 
 def create_empty_graph() -> RelationalGraphWithCuts:
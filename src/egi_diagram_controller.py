@@ -7,6 +7,7 @@ and atomic EGI operations, following Dau's formalism.
 
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
+from collections import defaultdict
 from frozendict import frozendict
 
 from egi_core_dau import RelationalGraphWithCuts, Vertex, Edge, Cut
@@ -20,6 +21,35 @@ class LigatureComponent:
     connected_predicates: Dict[str, int]  # predicate_id -> hook_position
 
 
+class _DSU:
+    """Disjoint-set union over integer indices (union by rank, path halving)."""
+    __slots__ = ('parent', 'rank')
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        # Ranks stay below log2(size), so one byte per node is enough
+        self.rank = bytearray(size)
+    
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    
+    def union(self, a: int, b: int) -> None:
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return
+        rank = self.rank
+        if rank[a] < rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+
+
 @dataclass
 class DiagramElement:
     """Base class for diagram elements that correspond to EGI components"""
@@ -38,11 +68,14 @@ class EGIDiagramController:
     def __init__(self, egi: RelationalGraphWithCuts):
         self.egi = egi
         self.ligatures: Dict[str, LigatureComponent] = {}
+        # Derived vertex -> ligature key mapping, rebuilt with the ligatures
+        self._vertex_ligatures: Dict[str, str] = {}
         self._build_ligature_map()
     
     def _build_ligature_map(self):
         """Build ligature components from current EGI state using Dau-compliant methods"""
         self.ligatures.clear()
+        self._vertex_ligatures.clear()
         
         # Find all identity edges (κ(e) = "=") using Dau-compliant access
         identity_edges = set()
@@ -50,36 +83,46 @@ class EGIDiagramController:
             if self.egi.get_relation_name(edge.id) == "=":
                 identity_edges.add(edge.id)
         
-        # Build connected components (ligatures)
-        visited_vertices = set()
+        # Index every vertex, plus any other id an identity edge names
+        index = {vertex.id: i for i, vertex in enumerate(self.egi.V)}
+        for edge_id in identity_edges:
+            for v_id in self.egi.get_incident_vertices(edge_id):
+                index.setdefault(v_id, len(index))
+        
+        # Each identity edge is a clique: union its vertices with the first one
+        dsu = _DSU(len(index))
+        for edge_id in identity_edges:
+            vertex_seq = self.egi.get_incident_vertices(edge_id)
+            if vertex_seq:
+                anchor = index[vertex_seq[0]]
+                for v_id in vertex_seq[1:]:
+                    dsu.union(anchor, index[v_id])
+        
+        members = defaultdict(set)
+        for v_id, i in index.items():
+            members[dsu.find(i)].add(v_id)
+        
+        # Build connected components (ligatures), numbered by first vertex seen
         ligature_id = 0
         
         for vertex in self.egi.V:
-            if vertex.id in visited_vertices:
-                continue
-                
-            # Find all vertices connected via identity edges
-            connected_vertices = self._find_connected_vertices(vertex.id, identity_edges)
+            connected_vertices = members.pop(dsu.find(index[vertex.id]), None)
             
             if connected_vertices:
                 ligature_key = f"ligature_{ligature_id}"
                 
-                # Find predicates connected to this ligature using Dau-compliant methods
+                # Find predicates and identity edges touching this ligature via the
+                # graph's incidence index; each edge is recorded once per ligature
                 connected_predicates = {}
-                for v_id in connected_vertices:
-                    for edge in self.egi.E:
-                        if self.egi.get_relation_name(edge.id) != "=":
-                            vertex_seq = self.egi.get_incident_vertices(edge.id)
-                            if v_id in vertex_seq:
-                                hook_position = vertex_seq.index(v_id)
-                                connected_predicates[edge.id] = hook_position
-                
-                # Find identity edges in this ligature
                 ligature_identity_edges = set()
-                for edge_id in identity_edges:
-                    vertex_seq = self.egi.get_incident_vertices(edge_id)
-                    if any(v_id in connected_vertices for v_id in vertex_seq):
-                        ligature_identity_edges.add(edge_id)
+                for v_id in connected_vertices:
+                    self._vertex_ligatures[v_id] = ligature_key
+                    for edge_id in self.egi.get_incident_edges(v_id):
+                        if edge_id in identity_edges:
+                            ligature_identity_edges.add(edge_id)
+                        else:
+                            vertex_seq = self.egi.get_incident_vertices(edge_id)
+                            connected_predicates[edge_id] = vertex_seq.index(v_id)
                 
                 self.ligatures[ligature_key] = LigatureComponent(
                     vertices=connected_vertices,
@@ -87,29 +130,8 @@ class EGIDiagramController:
                     connected_predicates=connected_predicates
                 )
                 
-                visited_vertices.update(connected_vertices)
                 ligature_id += 1
     
-    def _find_connected_vertices(self, start_vertex: str, identity_edges: Set[str]) -> Set[str]:
-        """Find all vertices connected to start_vertex via identity edges using Dau-compliant methods"""
-        connected = {start_vertex}
-        queue = [start_vertex]
-        
-        while queue:
-            current = queue.pop(0)
-            
-            # Check all identity edges using Dau-compliant access
-            for edge_id in identity_edges:
-                vertex_seq = self.egi.get_incident_vertices(edge_id)
-                if current in vertex_seq:
-                    # Add all other vertices in this identity edge
-                    for v_id in vertex_seq:
-                        if v_id not in connected:
-                            connected.add(v_id)
-                            queue.append(v_id)
-        
-        return connected
-    
     def attach_loi_to_predicate(self, loi_endpoint_vertex: str, predicate_id: str, hook_position: int) -> bool:
         """
         Attach a Line of Identity endpoint to a predicate hook.
@@ -313,10 +335,7 @@ class EGIDiagramController:
     
     def get_ligature_for_vertex(self, vertex_id: str) -> Optional[str]:
         """Find which ligature contains the given vertex"""
-        for ligature_id, ligature in self.ligatures.items():
-            if vertex_id in ligature.vertices:
-                return ligature_id
-        return None
+        return self._vertex_ligatures.get(vertex_id)
     
     def get_predicate_hooks(self, predicate_id: str) -> List[Tuple[int, Optional[str]]]:
         """Get all hooks for a predicate with their positions and connected vertices"""
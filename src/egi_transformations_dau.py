@@ -10,7 +10,7 @@ Key improvements over previous transformations:
 - Mathematically rigorous validation
 """
 
-from typing import Optional, Set, List, Tuple
+from typing import AbstractSet, Optional, Set, List, Tuple
 from frozendict import frozendict
 from egi_core_dau import (
     RelationalGraphWithCuts, Vertex, Edge, Cut, ElementID,
@@ -194,15 +194,14 @@ def apply_double_cut_removal(graph: RelationalGraphWithCuts, outer_cut_id: Eleme
     outer_area = graph.get_area(outer_cut_id)
     
     # Find inner cut
-    inner_cuts = [eid for eid in outer_area if eid in graph._cut_map]
+    inner_cuts = graph.get_child_cuts(outer_cut_id)
     if len(inner_cuts) != 1:
         raise TransformationError("Double cut must have exactly one inner cut")
     
-    inner_cut_id = inner_cuts[0]
+    inner_cut_id, = inner_cuts
     
     # Check nothing else between cuts
-    non_cut_elements = [eid for eid in outer_area if eid not in graph._cut_map]
-    if non_cut_elements:
+    if len(outer_area) != 1:
         raise TransformationError("Double cut must have nothing between cuts")
     
     # Get parent context and inner cut contents
@@ -269,17 +268,18 @@ def apply_isolated_vertex_removal(graph: RelationalGraphWithCuts, vertex_id: Ele
 
 # Utility functions
 
-def _get_all_element_ids(graph: RelationalGraphWithCuts) -> Set[ElementID]:
+def _get_all_element_ids(graph: RelationalGraphWithCuts) -> AbstractSet[ElementID]:
     """Get all element IDs in the graph."""
-    return ({v.id for v in graph.V} | 
-            {e.id for e in graph.E} | 
-            {c.id for c in graph.Cut})
+    # Every element lies in exactly one area, so the graph's cached
+    # element -> context map is already keyed by all element IDs
+    return graph._context_map.keys()
 
 
 def _context_dominates_or_equal(graph: RelationalGraphWithCuts, 
                                context1: ElementID, context2: ElementID) -> bool:
     """Check if context1 dominates or equals context2."""
-    if context1 == context2:
+    # The sheet dominates every context - no walk needed
+    if context1 == context2 or context1 == graph.sheet:
         return True
     
     # Check if context1 is ancestor of context2
@@ -18,9 +18,12 @@ class EGIFGenerator:
         self.vertex_labels = {}  # Maps vertex IDs to EGIF labels
         self.used_labels = set()
         self.defining_vertices = set()  # Track which vertices are defining
+        self._context_chains = {}  # Memoized context -> enclosing contexts up to sheet
         
     def generate(self) -> str:
         """Generate EGIF expression from graph."""
+        self._context_chains = {}
+        
         # Assign labels to vertices and determine defining occurrences
         self._assign_vertex_labels()
         
@@ -233,8 +236,7 @@ class EGIFGenerator:
         edge_context = self.graph.get_context(edge_id)
         
         # Check current context and all parent contexts for this variable
-        current_context = edge_context
-        while current_context is not None:
+        for current_context in self._get_context_chain(edge_context):
             # Check if this variable appears in any earlier elements in current context
             context_area = self.graph.get_area(current_context)
             
@@ -260,20 +262,41 @@ class EGIFGenerator:
                                 other_vertex.label == vertex.label):
                                 # Same variable name used earlier - this is bound
                                 return False
-            
-            # Move to parent context
+        
+        # No earlier use found in this context or any parent context - this is defining
+        return True
+    
+    def _get_context_chain(self, context_id: ElementID) -> Tuple[ElementID, ...]:
+        """Get context and its enclosing contexts up to the sheet (memoized per generate)."""
+        context_chains = self._context_chains
+        chain = context_chains.get(context_id)
+        if chain is not None:
+            return chain
+        
+        # Walk up until the sheet or a context whose chain is already known
+        pending = []
+        current_context = context_id
+        while current_context not in context_chains:
+            pending.append(current_context)
             if current_context == self.graph.sheet:
                 break
             current_context = self.graph.get_context(current_context)
         
-        # No earlier use found in this context or any parent context - this is defining
-        return True
+        chain = context_chains.get(current_context, ())
+        for context in reversed(pending):
+            chain = (context,) + chain
+            context_chains[context] = chain
+        return chain
 
 
 def generate_egif(graph: RelationalGraphWithCuts) -> str:
     """Generate EGIF expression from Dau-compliant graph."""
-    generator = EGIFGenerator(graph)
-    return generator.generate()
+    egif = graph._egif_cache
+    if egif is None:
+        generator = EGIFGenerator(graph)
+        egif = generator.generate()
+        object.__setattr__(graph, '_egif_cache', egif)
+    return egif
 
 
 if __name__ == "__main__":
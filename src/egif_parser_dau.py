@@ -37,9 +37,16 @@ class TokenType(Enum):
     EOF = "EOF"                 # end of input
 
 
+# Token type groups used for membership tests in the syntax validator and parser
+ARGUMENT_TOKEN_TYPES = frozenset({TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT})
+AREA_END_TOKEN_TYPES = frozenset({TokenType.RBRACKET, TokenType.EOF})
+
+
 @dataclass
 class Token:
     """Token in EGIF expression."""
+    __slots__ = ('type', 'value', 'position')
+    
     type: TokenType
     value: str
     position: int
@@ -199,7 +206,7 @@ class EGIFSyntaxValidator:
             self._validate_cut()
         elif token.type == TokenType.LBRACKET:
             self._validate_scroll()
-        elif token.type in [TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT]:
+        elif token.type in ARGUMENT_TOKEN_TYPES:
             self._validate_isolated_vertex()
         else:
             raise ValueError(f"Unexpected token {token.type} at position {token.position}")
@@ -215,7 +222,7 @@ class EGIFSyntaxValidator:
         self._advance()
         
         # Validate arguments
-        while self._current_token().type in [TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT]:
+        while self._current_token().type in ARGUMENT_TOKEN_TYPES:
             self._advance()
         
         if self._current_token().type != TokenType.RPAREN:
@@ -229,7 +236,7 @@ class EGIFSyntaxValidator:
         self._advance()
         
         # Validate cut contents
-        while self._current_token().type not in [TokenType.RBRACKET, TokenType.EOF]:
+        while self._current_token().type not in AREA_END_TOKEN_TYPES:
             self._validate_node()
         
         if self._current_token().type != TokenType.RBRACKET:
@@ -253,7 +260,7 @@ class EGIFSyntaxValidator:
     def _validate_isolated_vertex(self):
         """Validate isolated vertex (heavy dot)."""
         token = self._current_token()
-        if token.type not in [TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT]:
+        if token.type not in ARGUMENT_TOKEN_TYPES:
             raise ValueError(f"Invalid isolated vertex token: {token.type}")
         self._advance()
 
@@ -351,7 +358,7 @@ class EGIFParser:
             self._parse_cut(context_id)
         elif token.type == TokenType.LBRACKET:
             self._parse_scroll(context_id)
-        elif token.type in [TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT]:
+        elif token.type in ARGUMENT_TOKEN_TYPES:
             self._parse_isolated_vertex(context_id)
         else:
             raise ValueError(f"Unexpected token {token.type} at position {token.position}")
@@ -370,7 +377,7 @@ class EGIFParser:
         
         # Parse arguments
         vertex_ids = []
-        while self._current_token().type in [TokenType.DEFINING_VAR, TokenType.BOUND_VAR, TokenType.CONSTANT]:
+        while self._current_token().type in ARGUMENT_TOKEN_TYPES:
             vertex_id = self._parse_argument(context_id)
             vertex_ids.append(vertex_id)
         
@@ -441,7 +448,7 @@ class EGIFParser:
         self.graph = self.graph.with_cut(cut, context_id)
         
         # Parse cut contents
-        while self._current_token().type not in [TokenType.RBRACKET, TokenType.EOF]:
+        while self._current_token().type not in AREA_END_TOKEN_TYPES:
             self._parse_node(cut.id)
         
         if self._current_token().type != TokenType.RBRACKET:
@@ -6,7 +6,7 @@ CHANGES: Created to bridge the gap between test probe descriptions (like "(Morta
 and actual graph element IDs. Provides structural matching and element resolution.
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 from egi_core_dau import RelationalGraphWithCuts, ElementID
 from egif_parser_dau import parse_egif
 
@@ -58,12 +58,10 @@ class ElementIdentifier:
     
     def _get_nesting_level(self, element_id: ElementID) -> int:
         """Get nesting level of element (0 = sheet, 1 = first cut, etc.)."""
-        level = 0
-        current = element_id
-        while current != self.graph.sheet:
-            current = self.graph.get_context(current)
-            level += 1
-        return level
+        if element_id == self.graph.sheet:
+            return 0
+        # The graph memoizes depths, so shared ancestors are walked only once
+        return self.graph.get_nesting_depth(element_id) + 1
     
     def find_vertex_by_structure(self, label: str, is_generic: bool = True, 
                                 context_id: Optional[ElementID] = None) -> Optional[ElementID]:
@@ -108,22 +106,24 @@ class ElementIdentifier:
             List of matching element IDs
         """
         try:
-            # Parse the probe to understand its structure
-            if probe.startswith('[') and probe.endswith(']'):
-                # Isolated vertex
-                return self._find_isolated_vertex(probe, context_hint)
-            elif probe.startswith('(') and probe.endswith(')'):
-                # Relation/edge
-                return self._find_relation(probe, context_hint)
-            elif probe.startswith('~[') and probe.endswith(']'):
-                # Cut or subgraph
-                return self._find_cut_or_subgraph(probe, context_hint)
-            else:
-                return []
+            return list(self.iter_elements_by_egif_probe(probe, context_hint))
         except Exception:
             return []
     
-    def _find_isolated_vertex(self, probe: str, context_hint: Optional[str]) -> List[ElementID]:
+    def iter_elements_by_egif_probe(self, probe: str, context_hint: Optional[str] = None) -> Iterator[ElementID]:
+        """Yield elements matching an EGIF probe string lazily, so first-match lookups stop early."""
+        # Parse the probe to understand its structure
+        if probe.startswith('[') and probe.endswith(']'):
+            # Isolated vertex
+            yield from self._find_isolated_vertex(probe, context_hint)
+        elif probe.startswith('(') and probe.endswith(')'):
+            # Relation/edge
+            yield from self._find_relation(probe, context_hint)
+        elif probe.startswith('~[') and probe.endswith(']'):
+            # Cut or subgraph
+            yield from self._find_cut_or_subgraph(probe, context_hint)
+    
+    def _find_isolated_vertex(self, probe: str, context_hint: Optional[str]) -> Iterator[ElementID]:
         """Find isolated vertex from probe like '[*x]' or '["Alice"]'."""
         content = probe[1:-1]  # Remove brackets
         
@@ -144,27 +144,24 @@ class ElementIdentifier:
         candidates = self.vertices_by_label.get((label, is_generic), [])
         
         # Filter by isolation and context if specified
-        result = []
         for vertex_id in candidates:
             if self.graph.is_vertex_isolated(vertex_id):
                 if context_hint is None:
-                    result.append(vertex_id)
+                    yield vertex_id
                 else:
                     # Apply context filtering
                     vertex_context = self.graph.get_context(vertex_id)
                     if self._matches_context_hint(vertex_context, context_hint):
-                        result.append(vertex_id)
-        
-        return result
+                        yield vertex_id
     
-    def _find_relation(self, probe: str, context_hint: Optional[str]) -> List[ElementID]:
+    def _find_relation(self, probe: str, context_hint: Optional[str]) -> Iterator[ElementID]:
         """Find relation from probe like '(Mortal x)' or '(Human *x)'."""
         # Simple parsing - extract relation name and arguments
         content = probe[1:-1]  # Remove parentheses
         parts = content.split()
         
         if not parts:
-            return []
+            return
         
         relation_name = parts[0]
         vertex_specs = parts[1:]
@@ -183,16 +180,14 @@ class ElementIdentifier:
         candidates = self.edges_by_relation.get((relation_name, tuple(vertex_labels)), [])
         
         if context_hint is None:
-            return candidates
+            yield from candidates
+            return
         
         # Filter by context
-        result = []
         for edge_id in candidates:
             edge_context = self.graph.get_context(edge_id)
             if self._matches_context_hint(edge_context, context_hint):
-                result.append(edge_id)
-        
-        return result
+                yield edge_id
     
     def _find_cut_or_subgraph(self, probe: str, context_hint: Optional[str]) -> List[ElementID]:
         """Find cut or subgraph from probe like '~[(P x)]'."""
@@ -201,7 +196,7 @@ class ElementIdentifier:
         
         if probe == "~[]":
             # Empty cut
-            for cut_id in [c.id for c in self.graph.Cut]:
+            for cut_id in self.graph._cut_map:
                 if not self.graph.get_area(cut_id):  # Empty area
                     return [cut_id]
         
@@ -229,13 +224,13 @@ class ElementIdentifier:
             return self.graph.sheet
         elif "positive context" in description:
             # Find a positive context (even nesting level)
-            for cut_id in [c.id for c in self.graph.Cut]:
+            for cut_id in self.graph._cut_map:
                 if self.graph.is_positive_context(cut_id):
                     return cut_id
             return self.graph.sheet  # Sheet is always positive
         elif "negative context" in description:
             # Find a negative context (odd nesting level)
-            for cut_id in [c.id for c in self.graph.Cut]:
+            for cut_id in self.graph._cut_map:
                 if self.graph.is_negative_context(cut_id):
                     return cut_id
         elif "after" in description or "beside" in description:
@@ -256,8 +251,11 @@ def find_element_in_graph(graph: RelationalGraphWithCuts, probe: str,
                          context_hint: Optional[str] = None) -> Optional[ElementID]:
     """Convenience function to find single element in graph by probe."""
     identifier = ElementIdentifier(graph)
-    matches = identifier.find_elements_by_egif_probe(probe, context_hint)
-    return matches[0] if matches else None
+    try:
+        # Only the first match is needed, so stop the search there
+        return next(identifier.iter_elements_by_egif_probe(probe, context_hint), None)
+    except Exception:
+        return None
 
 
 def find_all_elements_in_graph(graph: RelationalGraphWithCuts, probe: str,
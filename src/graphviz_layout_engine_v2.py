@@ -17,13 +17,15 @@ Architecture:
 - EGI area containment → Nested subgraph structure
 """
 
+import re
 import subprocess
 import tempfile
 import os
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 from egi_core_dau import RelationalGraphWithCuts, ElementID
-from layout_engine_clean import LayoutResult, SpatialPrimitive
+from layout_engine_clean import LayoutResult, SpatialPrimitive, attachment_point_keys
 from xdot_parser_simple import parse_xdot_file
 from pipeline_contracts import (
     enforce_contracts, 
@@ -42,6 +44,33 @@ except ImportError:
     print("⚠️  Layout post-processor not available - using basic spacing")
 
 
+@lru_cache(maxsize=4096)
+def _dot_id(element_id: str) -> str:
+    """DOT-safe form of an element ID, cached since every ID is sanitized several times per layout."""
+    # Replace problematic characters with underscores
+    sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', str(element_id))
+    # Ensure it starts with a letter or underscore
+    if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
+        sanitized = '_' + sanitized
+    return sanitized or '_unknown'
+
+
+@lru_cache(maxsize=64)
+def _cluster_style_lines(indent_str: str, cluster_padding: float) -> Tuple[str, ...]:
+    """Pre-rendered attribute lines shared by every cut cluster at one indent level."""
+    return (
+        f"{indent_str}  style=rounded;",
+        f"{indent_str}  color=black;",
+        f"{indent_str}  penwidth=1.5;",
+        f"{indent_str}  margin={cluster_padding:.2f};  // Padding around cut contents",
+        f"{indent_str}  labelloc=top;",
+        f"{indent_str}  fontsize=8;",
+        f"{indent_str}  // Leverage Graphviz hierarchical layout",
+        f"{indent_str}  clusterrank=local;  // Layout this cluster separately",
+        "",
+    )
+
+
 @dataclass
 class GraphvizElement:
     """Represents an element in Graphviz with its attributes."""
@@ -66,13 +95,7 @@ class GraphvizLayoutEngine:
     
     def _sanitize_dot_id(self, element_id: str) -> str:
         """Sanitize element ID for DOT syntax compliance."""
-        # Replace problematic characters with underscores
-        import re
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', str(element_id))
-        # Ensure it starts with a letter or underscore
-        if sanitized and not sanitized[0].isalpha() and sanitized[0] != '_':
-            sanitized = '_' + sanitized
-        return sanitized or '_unknown'
+        return _dot_id(element_id)
     
     def _calculate_vertex_size(self, vertex, graph: RelationalGraphWithCuts) -> Tuple[float, float]:
         """Calculate appropriate size for a vertex based on its label and connections."""
@@ -230,10 +253,7 @@ class GraphvizLayoutEngine:
     
     def _get_cut_parent(self, cut, graph: RelationalGraphWithCuts) -> str:
         """Find the parent area of a cut."""
-        for area_id, contents in graph.area.items():
-            if cut.id in contents:
-                return area_id
-        return graph.sheet  # Default to sheet level
+        return graph._context_map.get(cut.id, graph.sheet)  # Default to sheet level
     
     def _add_cluster_recursive(self, dot_lines: List[str], cut, graph: RelationalGraphWithCuts, 
                              hierarchy: Dict[str, List], indent: int):
@@ -247,28 +267,19 @@ class GraphvizLayoutEngine:
         
         dot_lines.append(f"{indent_str}subgraph cluster_{safe_cut_id} {{")
         dot_lines.append(f"{indent_str}  label=\"Cut {cut.id[:8]}\";")
-        dot_lines.append(f"{indent_str}  style=rounded;")
-        dot_lines.append(f"{indent_str}  color=black;")
-        dot_lines.append(f"{indent_str}  penwidth=1.5;")
-        dot_lines.append(f"{indent_str}  margin={cluster_padding:.2f};  // Padding around cut contents")
-        dot_lines.append(f"{indent_str}  labelloc=top;")
-        dot_lines.append(f"{indent_str}  fontsize=8;")
-        dot_lines.append(f"{indent_str}  // Leverage Graphviz hierarchical layout")
-        dot_lines.append(f"{indent_str}  clusterrank=local;  // Layout this cluster separately")
-        dot_lines.append("")
+        dot_lines.extend(_cluster_style_lines(indent_str, cluster_padding))
         
         # Add child cuts recursively
         child_cuts = hierarchy.get(cut.id, [])
         for child_cut in child_cuts:
             self._add_cluster_recursive(dot_lines, child_cut, graph, hierarchy, indent + 1)
         
-        # Add vertices and edges that belong to this cut
-        cut_contents = graph.area.get(cut.id, [])
-        
         # SIMPLE FIX: Use EGI core's get_area() method to get cut contents
         cut_contents = graph.get_area(cut.id)
         
-        # Add vertices in this cut
+        # Single pass over the cut contents; vertices are emitted before predicates
+        vertex_lines = []
+        predicate_lines = []
         for element_id in cut_contents:
             if element_id in graph._vertex_map:
                 vertex = graph._vertex_map[element_id]
@@ -280,21 +291,21 @@ class GraphvizLayoutEngine:
                     label = safe_node_id[:8]
                 
                 width, height = self._calculate_vertex_size(vertex, graph)
-                dot_lines.append(f"{indent_str}  {safe_node_id} [label={label}, width={width:.2f}, height={height:.2f}, fixedsize=true];")
-        
-        # Add predicates (edges) in this cut
-        for element_id in cut_contents:
-            if element_id in graph.nu:  # This is a predicate edge
+                vertex_lines.append(f"{indent_str}  {safe_node_id} [label={label}, width={width:.2f}, height={height:.2f}, fixedsize=true];")
+            
+            elif element_id in graph.nu:  # This is a predicate edge
                 predicate_name = graph.rel.get(element_id, element_id[:8])
                 # CONSISTENT IDs: Use original EGI element ID directly (no pred_ prefix)
                 safe_edge_id = self._sanitize_dot_id(element_id)
                 
                 width, height = self._calculate_predicate_dimensions(predicate_name)
-                dot_lines.append(f"{indent_str}  {safe_edge_id} [label=\"{predicate_name}\", shape=box, fillcolor=lightyellow, width={width:.2f}, height={height:.2f}, fixedsize=true];")
+                predicate_lines.append(f"{indent_str}  {safe_edge_id} [label=\"{predicate_name}\", shape=box, fillcolor=lightyellow, width={width:.2f}, height={height:.2f}, fixedsize=true];")
+        
+        dot_lines.extend(vertex_lines)
+        dot_lines.extend(predicate_lines)
         
         # End subgraph cluster
-        dot_lines.append(f"{indent_str}}}")
-        dot_lines.append("")
+        dot_lines.extend([f"{indent_str}}}", ""])
     
     def _add_vertices_as_nodes(self, dot_lines: List[str], graph: RelationalGraphWithCuts):
         """Add EGI vertices as Graphviz nodes (only sheet-level vertices)."""
@@ -324,45 +335,48 @@ class GraphvizLayoutEngine:
     def _add_edges_for_predicates(self, dot_lines: List[str], graph: RelationalGraphWithCuts):
         """Add EGI edges (predicates and identity lines) as Graphviz edges."""
         
+        # Bind loop-invariant lookups once
+        rel = graph.rel
+        sanitize = self._sanitize_dot_id
+        append_line = dot_lines.append
+        # SIMPLE FIX: Only process predicates that are at sheet level (not in cuts)
+        sheet_contents = graph.get_area(graph.sheet)
+        
         # Add edges for predicates
         for edge_id, vertex_sequence in graph.nu.items():
             if len(vertex_sequence) >= 2:
                 # Multi-vertex predicate: connect all vertices
-                predicate_name = graph.rel.get(edge_id, edge_id[:8])
+                predicate_name = rel.get(edge_id, edge_id[:8])
                 safe_predicate_name = predicate_name.replace('"', '\\"')
                 
                 for i in range(len(vertex_sequence) - 1):
                     v1, v2 = vertex_sequence[i], vertex_sequence[i + 1]
-                    safe_v1 = self._sanitize_dot_id(v1)
-                    safe_v2 = self._sanitize_dot_id(v2)
-                    dot_lines.append(f"  {safe_v1} -- {safe_v2} [label=\"{safe_predicate_name}\", style=bold];")
+                    safe_v1 = sanitize(v1)
+                    safe_v2 = sanitize(v2)
+                    append_line(f"  {safe_v1} -- {safe_v2} [label=\"{safe_predicate_name}\", style=bold];")
             
             elif len(vertex_sequence) == 1:
                 # Single-vertex predicate: create a predicate node with proper sizing
-                # SIMPLE FIX: Only process predicates that are at sheet level (not in cuts)
-                sheet_contents = graph.get_area(graph.sheet)
-                predicate_at_sheet_level = edge_id in sheet_contents
-                
                 # Only generate predicate node if it's at sheet level
-                if predicate_at_sheet_level:
+                if edge_id in sheet_contents:
                     vertex_id = vertex_sequence[0]
-                    predicate_name = graph.rel.get(edge_id, edge_id[:8])
-                    safe_vertex_id = self._sanitize_dot_id(vertex_id)
+                    predicate_name = rel.get(edge_id, edge_id[:8])
+                    safe_vertex_id = sanitize(vertex_id)
                     safe_predicate_name = predicate_name.replace('"', '\\"')
                     # CONSISTENT IDs: Use original EGI element ID directly (no pred_ prefix)
-                    predicate_node_id = self._sanitize_dot_id(edge_id)
+                    predicate_node_id = sanitize(edge_id)
                     
                     # Calculate proper size for predicate node
                     pred_width, pred_height = self._calculate_predicate_dimensions(predicate_name)
                     
                     # Generate predicate node with sizing and styling
-                    dot_lines.append(f"  {predicate_node_id} [label=\"{safe_predicate_name}\", shape=box, "
-                                   f"fillcolor=lightyellow, width={pred_width:.2f}, height={pred_height:.2f}, fixedsize=true];")
+                    append_line(f"  {predicate_node_id} [label=\"{safe_predicate_name}\", shape=box, "
+                                f"fillcolor=lightyellow, width={pred_width:.2f}, height={pred_height:.2f}, fixedsize=true];")
                     
                     # Generate edge with enhanced routing attributes
-                    dot_lines.append(f"  {safe_vertex_id} -- {predicate_node_id} [style=bold, penwidth=2, len=1.5];")
+                    append_line(f"  {safe_vertex_id} -- {predicate_node_id} [style=bold, penwidth=2, len=1.5];")
         
-        dot_lines.append("")
+        append_line("")
     
     def _execute_graphviz(self, dot_content: str) -> str:
         """
@@ -408,7 +422,6 @@ class GraphvizLayoutEngine:
             clusters, nodes, edges = parse_xdot_file(xdot_output)
             
             # Extract main graph bounding box
-            import re
             graph_bb_match = re.search(r'graph \[.*?bb="([^"]+)"', xdot_output, re.DOTALL)
             if graph_bb_match:
                 bb_coords = graph_bb_match.group(1).split(',')
@@ -416,29 +429,37 @@ class GraphvizLayoutEngine:
                     x1, y1, x2, y2 = map(float, bb_coords)
                     canvas_bounds = (x1, y1, x2, y2)
             
+            # DOT cluster id -> cut id, built once instead of re-sanitizing every cut per cluster
+            cut_ids_by_dot_id = {}
+            for cut_id in graph._cut_map:
+                cut_ids_by_dot_id.setdefault(self._sanitize_dot_id(cut_id), cut_id)
+            
             # Process clusters (cuts) using the proven parser
             for cluster in clusters:
                 cluster_name = cluster.name
                 x1, y1, x2, y2 = cluster.bb
                 
                 # Find matching cut in graph
-                cut_id_part = cluster_name.replace('cluster_', '')
-                for cut in graph.Cut:
-                    if self._sanitize_dot_id(cut.id) == cut_id_part:
-                        # Create cut primitive using Graphviz's native cluster boundary
-                        center_x = (x1 + x2) / 2
-                        center_y = (y1 + y2) / 2
-                        
-                        cut_primitive = SpatialPrimitive(
-                            element_id=cut.id,
-                            element_type='cut',
-                            position=(center_x, center_y),
-                            bounds=(x1, y1, x2, y2),
-                            z_index=0
-                        )
-                        primitives[cut.id] = cut_primitive
-                        print(f"✅ Using Graphviz cluster boundary for {cut.id}: bounds=({x1}, {y1}, {x2}, {y2})")
-                        break
+                cut_id = cut_ids_by_dot_id.get(cluster_name.replace('cluster_', ''))
+                if cut_id is not None:
+                    # Create cut primitive using Graphviz's native cluster boundary
+                    center_x = (x1 + x2) / 2
+                    center_y = (y1 + y2) / 2
+                    
+                    cut_primitive = SpatialPrimitive(
+                        element_id=cut_id,
+                        element_type='cut',
+                        position=(center_x, center_y),
+                        bounds=(x1, y1, x2, y2),
+                        z_index=0
+                    )
+                    primitives[cut_id] = cut_primitive
+                    print(f"✅ Using Graphviz cluster boundary for {cut_id}: bounds=({x1}, {y1}, {x2}, {y2})")
+            
+            # Node positions by name, built once for predicate attachment lookups
+            node_positions = {}
+            for node in nodes:
+                node_positions.setdefault(node.name, node.pos)
             
             # Process nodes using the proven parser
             for node in nodes:
@@ -499,13 +520,12 @@ class GraphvizLayoutEngine:
                     vertex_sequence = graph.nu[original_element_id]
                     attachment_points = {}
                     
-                    for i, vertex_id in enumerate(vertex_sequence):
+                    point_keys = attachment_point_keys(len(vertex_sequence))
+                    for point_key, vertex_id in zip(point_keys, vertex_sequence):
                         # Find vertex position in the same layout
-                        for other_node in nodes:
-                            if other_node.name == vertex_id:
-                                vertex_x, vertex_y = other_node.pos
-                                attachment_points[f"vertex_{i}"] = (vertex_x, vertex_y)
-                                break
+                        if vertex_id in node_positions:
+                            vertex_x, vertex_y = node_positions[vertex_id]
+                            attachment_points[point_key] = (vertex_x, vertex_y)
                 
                 primitive = SpatialPrimitive(
                     element_id=original_element_id,  # Use original EGI ID, not DOT node ID
@@ -558,13 +578,9 @@ class GraphvizLayoutEngine:
             primitives = {}
             self._ensure_complete_element_coverage(graph, primitives, canvas_bounds)
         
-        # Build containment hierarchy
-        containment_hierarchy = {}
-        containment_hierarchy[graph.sheet] = set()
-        for area_id, contents in graph.area.items():
-            if area_id not in containment_hierarchy:
-                containment_hierarchy[area_id] = set()
-            containment_hierarchy[area_id].update(contents)
+        # Build containment hierarchy (shares the graph's immutable area sets)
+        containment_hierarchy = {graph.sheet: frozenset()}
+        containment_hierarchy.update(graph.area)
         
         return LayoutResult(
             primitives=primitives,
@@ -744,40 +760,22 @@ class GraphvizLayoutEngine:
         Depth 0 = sheet level, depth 1 = cuts directly in sheet, etc.
         """
         hierarchy_by_depth = {}
+        cut_depths = self._calculate_cut_depths(graph)
         
-        def calculate_cut_depth(cut_id: str, visited: set = None) -> int:
-            """Calculate the nesting depth of a cut."""
-            if visited is None:
-                visited = set()
-            
-            if cut_id in visited:
-                return 0  # Avoid infinite recursion
-            visited.add(cut_id)
-            
-            # Find which area contains this cut
-            parent_area = None
-            for area_id, contents in graph.area.items():
-                if cut_id in contents:
-                    parent_area = area_id
-                    break
-            
-            if parent_area == graph.sheet:
-                return 1  # Direct child of sheet
-            elif parent_area:
-                # This cut is inside another cut
-                return 1 + calculate_cut_depth(parent_area, visited)
-            else:
-                return 0  # Shouldn't happen, but safe fallback
-        
-        # Calculate depth for each cut
+        # Group cuts by their nesting depth
         for cut in graph.Cut:
-            depth = calculate_cut_depth(cut.id)
+            depth = cut_depths[cut.id]
             if depth not in hierarchy_by_depth:
                 hierarchy_by_depth[depth] = []
             hierarchy_by_depth[depth].append(cut)
         
         return hierarchy_by_depth
     
+    def _calculate_cut_depths(self, graph: RelationalGraphWithCuts) -> Dict[str, int]:
+        """Calculate the nesting depth of every cut (direct children of the sheet are depth 1)."""
+        # get_nesting_depth counts enclosing cuts and is memoized on the graph
+        return {cut.id: graph.get_nesting_depth(cut.id) + 1 for cut in graph.Cut}
+    
     def _create_fallback_layout(self, graph: RelationalGraphWithCuts) -> LayoutResult:
         """Create a simple fallback layout when Graphviz fails."""
         primitives = {}
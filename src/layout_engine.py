@@ -5,7 +5,7 @@ Completely separated from rendering and data concerns.
 """
 
 from typing import Dict, List, Tuple, Optional, Set, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import math
 import uuid
@@ -40,16 +40,12 @@ class LayoutElement:
     
     # Spatial relationships
     parent_area: Optional[ElementID] = None
-    contained_elements: Set[ElementID] = None
+    contained_elements: Set[ElementID] = field(default_factory=set)
     
     # Geometric properties (following Dau's conventions)
     curve_points: Optional[List[Coordinate]] = None  # For cuts and edges
     attachment_points: Optional[Dict[str, Coordinate]] = None  # For predicate hooks
     
-    def __post_init__(self):
-        if self.contained_elements is None:
-            object.__setattr__(self, 'contained_elements', set())
-    
     def contains_point(self, point: Coordinate) -> bool:
         """Check if point is within this element's bounds"""
         x, y = point
@@ -79,15 +75,16 @@ class LayoutResult:
     
     def find_element_at_point(self, point: Coordinate) -> Optional[ElementID]:
         """Find the topmost element at the given point"""
-        # Check in reverse order to get topmost element
-        for element_id, element in reversed(list(self.elements.items())):
+        # Check in reverse order to get topmost element; dict views reverse
+        # in place, so hit tests don't copy the element table on every call
+        for element_id, element in reversed(self.elements.items()):
             if element.contains_point(point):
                 return element_id
         return None
     
     def get_elements_in_area(self, area_id: ElementID) -> Set[ElementID]:
         """Get all elements contained within an area"""
-        return self.containment_hierarchy.get(area_id, set())
+        return self.containment_hierarchy.get(area_id, frozenset())
 
 
 class LayoutEngine:
@@ -611,30 +608,18 @@ class LayoutEngine:
         depth_groups = {}
         
         for cut in graph.Cut:
-            depth = self._calculate_cut_depth(cut.id, graph)
-            if depth not in depth_groups:
-                depth_groups[depth] = []
-            depth_groups[depth].append(cut)
+            depth_groups.setdefault(self._calculate_cut_depth(cut.id, graph), []).append(cut)
         
         return depth_groups
     
     def _calculate_cut_depth(self, cut_id: ElementID, graph: RelationalGraphWithCuts) -> int:
         """Calculate nesting depth of a cut"""
-        depth = 0
-        current_area = self._find_parent_area(cut_id, graph)
-        
-        while current_area and current_area != graph.sheet:
-            depth += 1
-            current_area = self._find_parent_area(current_area, graph)
-        
-        return depth
+        # Memoized on the graph: cuts sharing ancestors reuse their depths
+        return graph.get_nesting_depth(cut_id)
     
     def _find_parent_area(self, element_id: ElementID, graph: RelationalGraphWithCuts) -> Optional[ElementID]:
         """Find the area that contains the given element"""
-        for area_id, elements in graph.area.items():
-            if element_id in elements:
-                return area_id
-        return None
+        return graph._context_map.get(element_id)
     
     def _find_containing_area(self, vertex_id: ElementID, graph: RelationalGraphWithCuts) -> Optional[ElementID]:
         """Find which area contains a vertex"""
@@ -739,7 +724,7 @@ class LayoutEngine:
         hierarchy = {}
         
         for area_id, contained_elements in graph.area.items():
-            hierarchy[area_id] = set(contained_elements)
+            hierarchy[area_id] = contained_elements
         
         return hierarchy
     
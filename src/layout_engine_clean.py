@@ -10,12 +10,25 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Set
 from egi_core_dau import RelationalGraphWithCuts, ElementID
 import math
+import sys
 
 
 # Type aliases
 Coordinate = Tuple[float, float]
 Bounds = Tuple[float, float, float, float]  # (x1, y1, x2, y2)
 
+# Interned "vertex_<i>" attachment-point keys for common predicate arities
+_ATTACHMENT_POINT_KEYS = tuple(sys.intern(f"vertex_{i}") for i in range(16))
+
+
+def attachment_point_keys(arity: int) -> Tuple[str, ...]:
+    """Get the attachment_points keys for a predicate of the given arity."""
+    if arity <= len(_ATTACHMENT_POINT_KEYS):
+        return _ATTACHMENT_POINT_KEYS[:arity]
+    return _ATTACHMENT_POINT_KEYS + tuple(
+        f"vertex_{i}" for i in range(len(_ATTACHMENT_POINT_KEYS), arity)
+    )
+
 
 @dataclass(frozen=True)
 class SpatialPrimitive:
@@ -108,14 +121,12 @@ class CleanLayoutEngine:
         """Build containment hierarchy from EGI area mapping."""
         hierarchy = {}
         
-        # Sheet contains its area
-        sheet_area = graph.area.get(graph.sheet, frozenset())
-        hierarchy[graph.sheet] = set(sheet_area)
+        # Sheet contains its area (the graph's frozensets are shared, not copied)
+        hierarchy[graph.sheet] = graph.area.get(graph.sheet, frozenset())
         
         # Each cut contains its area
         for cut in graph.Cut:
-            cut_area = graph.area.get(cut.id, frozenset())
-            hierarchy[cut.id] = set(cut_area)
+            hierarchy[cut.id] = graph.area.get(cut.id, frozenset())
         
         return hierarchy
     
@@ -153,16 +164,7 @@ class CleanLayoutEngine:
     
     def _find_parent_area(self, element_id: ElementID, graph: RelationalGraphWithCuts) -> Optional[ElementID]:
         """Find which area directly contains this element."""
-        # Check sheet first
-        if element_id in graph.area.get(graph.sheet, frozenset()):
-            return graph.sheet
-        
-        # Check each cut
-        for cut in graph.Cut:
-            if element_id in graph.area.get(cut.id, frozenset()):
-                return cut.id
-        
-        return None
+        return graph._context_map.get(element_id)
     
     def _layout_single_cut(self, cut, parent_area: Optional[ElementID], 
                           hierarchy: Dict[ElementID, Set[ElementID]],
@@ -190,7 +192,7 @@ class CleanLayoutEngine:
             )
         
         # Calculate cut size based on contents
-        contents = hierarchy.get(cut.id, set())
+        contents = hierarchy.get(cut.id, frozenset())
         cut_width, cut_height = self._calculate_cut_size(contents)
         
         # Position cut within available space
@@ -441,9 +443,8 @@ class CleanLayoutEngine:
                 )
                 
                 # Create attachment points for hooks
-                attachment_points = {}
-                for j, vertex_pos in enumerate(vertex_positions):
-                    attachment_points[f"vertex_{j}"] = vertex_pos
+                attachment_points = dict(zip(attachment_point_keys(len(vertex_positions)),
+                                             vertex_positions))
                 
                 edge_primitives[edge.id] = SpatialPrimitive(
                     element_id=edge.id,
@@ -750,14 +751,8 @@ class CleanLayoutEngine:
         if not cut_primitives:
             return sheet_bounds
         
-        # Find the rightmost cut boundary
-        max_cut_right = 0
-        max_cut_bottom = 0
-        
-        for cut_primitive in cut_primitives.values():
-            x1, y1, x2, y2 = cut_primitive.bounds
-            max_cut_right = max(max_cut_right, x2)
-            max_cut_bottom = max(max_cut_bottom, y2)
+        # Find the rightmost cut boundary (never left of the canvas origin)
+        max_cut_right = max(0, max(cut_primitive.bounds[2] for cut_primitive in cut_primitives.values()))
         
         # Position sheet-level elements to the right of all cuts
         sheet_x_start = max_cut_right + self.cut_padding
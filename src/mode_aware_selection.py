@@ -5,7 +5,7 @@ Implements different selection behaviors for Warmup vs Practice modes.
 """
 
 from dataclasses import dataclass
-from typing import Set, Optional, List, Dict, Any
+from typing import Set, Optional, Dict, Any, Sequence
 from enum import Enum
 import sys
 import os
@@ -55,16 +55,20 @@ class ActionType(Enum):
     LAYOUT_RESIZE = "layout_resize"
 
 
+# Action groups checked on every validate_action call
+_ADD_ACTIONS = frozenset({ActionType.ADD_VERTEX, ActionType.ADD_PREDICATE, ActionType.ADD_CUT})
+_CONNECTION_ACTIONS = frozenset({ActionType.CONNECT_ELEMENTS, ActionType.DISCONNECT_ELEMENTS})
+_MOVE_ACTIONS = frozenset({ActionType.MOVE_ELEMENT, ActionType.LAYOUT_MOVE})
+_DOUBLE_CUT_ACTIONS = frozenset({ActionType.APPLY_DOUBLE_CUT_ADDITION, ActionType.APPLY_DOUBLE_CUT_REMOVAL})
+_LAYOUT_ACTIONS = frozenset({ActionType.LAYOUT_MOVE, ActionType.LAYOUT_RESIZE})
+
+
 @dataclass
 class ValidationResult:
     """Result of selection/action validation."""
     is_valid: bool
     error_message: Optional[str] = None
-    warnings: List[str] = None
-    
-    def __post_init__(self):
-        if self.warnings is None:
-            self.warnings = []
+    warnings: Sequence[str] = ()
 
 
 @dataclass
@@ -104,6 +108,11 @@ class SelectionValidator:
     def get_available_actions(self, selection: SelectionState) -> Set[ActionType]:
         """Get available actions for current selection."""
         raise NotImplementedError
+    
+    def _element_exists(self, element_id: ElementID) -> bool:
+        """Check if element exists in graph."""
+        # Every element sits in exactly one area, so the graph's context map is an O(1) index
+        return element_id in self.graph._context_map or element_id == self.graph.sheet
 
 
 class WarmupSelectionValidator(SelectionValidator):
@@ -124,7 +133,7 @@ class WarmupSelectionValidator(SelectionValidator):
     
     def validate_action(self, action: ActionType, selection: SelectionState) -> ValidationResult:
         """Validate action - compositional freedom in Warmup mode."""
-        if action in [ActionType.ADD_VERTEX, ActionType.ADD_PREDICATE, ActionType.ADD_CUT]:
+        if action in _ADD_ACTIONS:
             # Can add elements anywhere syntactically valid
             return ValidationResult(True)
         
@@ -134,13 +143,13 @@ class WarmupSelectionValidator(SelectionValidator):
                 return ValidationResult(False, "No elements selected for deletion")
             return ValidationResult(True)
         
-        if action in [ActionType.CONNECT_ELEMENTS, ActionType.DISCONNECT_ELEMENTS]:
+        if action in _CONNECTION_ACTIONS:
             # Can modify connections freely
             if len(selection.selected_elements) < 2:
                 return ValidationResult(False, "Need at least 2 elements for connection operations")
             return ValidationResult(True)
         
-        if action in [ActionType.MOVE_ELEMENT, ActionType.LAYOUT_MOVE]:
+        if action in _MOVE_ACTIONS:
             # Can move elements within syntactic constraints
             if selection.is_empty():
                 return ValidationResult(False, "No elements selected for moving")
@@ -159,13 +168,6 @@ class WarmupSelectionValidator(SelectionValidator):
             actions.update({ActionType.CONNECT_ELEMENTS, ActionType.DISCONNECT_ELEMENTS})
         
         return actions
-    
-    def _element_exists(self, element_id: ElementID) -> bool:
-        """Check if element exists in graph."""
-        return (element_id in {v.id for v in self.graph.V} or
-                element_id in {e.id for e in self.graph.E} or
-                element_id in {c.id for c in self.graph.Cut} or
-                element_id == self.graph.sheet)
 
 
 class PracticeSelectionValidator(SelectionValidator):
@@ -200,10 +202,10 @@ class PracticeSelectionValidator(SelectionValidator):
         if action == ActionType.APPLY_ITERATION:
             return self._validate_iteration(selection)
         
-        if action in [ActionType.APPLY_DOUBLE_CUT_ADDITION, ActionType.APPLY_DOUBLE_CUT_REMOVAL]:
+        if action in _DOUBLE_CUT_ACTIONS:
             return self._validate_double_cut_operation(selection)
         
-        if action in [ActionType.LAYOUT_MOVE, ActionType.LAYOUT_RESIZE]:
+        if action in _LAYOUT_ACTIONS:
             # Layout-only operations are generally allowed
             return ValidationResult(True)
         
@@ -281,13 +283,13 @@ class PracticeSelectionValidator(SelectionValidator):
         # For now, assume selections are complete
         # Full implementation would check vertex-edge connectivity
         return ValidationResult(True)
-    
-    def _element_exists(self, element_id: ElementID) -> bool:
-        """Check if element exists in graph."""
-        return (element_id in {v.id for v in self.graph.V} or
-                element_id in {e.id for e in self.graph.E} or
-                element_id in {c.id for c in self.graph.Cut} or
-                element_id == self.graph.sheet)
+
+
+# Validator class for each mode, looked up whenever the mode or graph changes
+_VALIDATOR_BY_MODE = {
+    Mode.WARMUP: WarmupSelectionValidator,
+    Mode.PRACTICE: PracticeSelectionValidator,
+}
 
 
 class ModeAwareSelectionSystem:
@@ -366,10 +368,7 @@ class ModeAwareSelectionSystem:
             self.validator = None
             return
         
-        if self.mode == Mode.WARMUP:
-            self.validator = WarmupSelectionValidator(self.graph)
-        else:
-            self.validator = PracticeSelectionValidator(self.graph)
+        self.validator = _VALIDATOR_BY_MODE[self.mode](self.graph)
     
     def _validate_current_selection(self) -> ValidationResult:
         """Validate current selection state."""
@@ -415,12 +415,10 @@ def validate_graphviz_dot_output(dot_content: str, graph: Any) -> bool:
     # Verify proper cluster nesting structure
     lines = dot_content.split('\n')
     cluster_depth = 0
-    max_depth = 0
     
     for line in lines:
         if 'subgraph cluster_' in line:
             cluster_depth += 1
-            max_depth = max(max_depth, cluster_depth)
         elif line.strip() == '}' and cluster_depth > 0:
             cluster_depth -= 1
     
@@ -16,7 +16,7 @@ CanvasBounds = Tuple[float, float, float, float]  # x1, y1, x2, y2
 RGBColor = Tuple[int, int, int]
 DrawingCommand = Dict[str, Any]
 
-@dataclass
+@dataclass(frozen=True)
 class PySide6RenderingStyle:
     """Standardized rendering style for PySide6 canvas operations."""
     
@@ -223,41 +223,43 @@ class PySide6ContractValidator:
         
         return True
 
-def create_dau_compliant_style(element_type: str) -> PySide6RenderingStyle:
-    """Create Dau-compliant rendering style for specific element types."""
-    
-    if element_type == "identity_line":
-        return PySide6RenderingStyle(
-            line_width=4.0,  # Heavy identity lines per Dau
-            line_color=(0, 0, 0),
-            line_style="solid"
-        )
-    elif element_type == "cut_boundary":
-        return PySide6RenderingStyle(
-            line_width=1.0,  # Fine cut boundaries per Dau
-            line_color=(0, 0, 0),
-            line_style="solid",
-            fill_color=None  # No fill for cuts
-        )
-    elif element_type == "vertex_spot":
-        return PySide6RenderingStyle(
-            line_width=1.0,
-            line_color=(0, 0, 0),
-            fill_color=(0, 0, 0),  # Filled spots
-            radius=3.5  # Prominent vertex spots
-        )
+# Dau-compliant style prototypes, built once and shared between commands
+_DAU_STYLES: Dict[str, PySide6RenderingStyle] = {
+    "identity_line": PySide6RenderingStyle(
+        line_width=4.0,  # Heavy identity lines per Dau
+        line_color=(0, 0, 0),
+        line_style="solid"
+    ),
+    "cut_boundary": PySide6RenderingStyle(
+        line_width=1.0,  # Fine cut boundaries per Dau
+        line_color=(0, 0, 0),
+        line_style="solid",
+        fill_color=None  # No fill for cuts
+    ),
+    "vertex_spot": PySide6RenderingStyle(
+        line_width=1.0,
+        line_color=(0, 0, 0),
+        fill_color=(0, 0, 0),  # Filled spots
+        radius=3.5  # Prominent vertex spots
+    ),
     # NOTE: hook_line removed - hooks are invisible positions per Dau formalism
     # Heavy identity lines connect directly to predicate boundary positions
-    elif element_type == "predicate_text":
-        return PySide6RenderingStyle(
-            font_family="Arial",
-            font_size=12,
-            font_weight="normal",
-            text_color=(0, 0, 0)
-        )
-    else:
-        # Default style
-        return PySide6RenderingStyle()
+    "predicate_text": PySide6RenderingStyle(
+        font_family="Arial",
+        font_size=12,
+        font_weight="normal",
+        text_color=(0, 0, 0)
+    ),
+}
+_DEFAULT_STYLE = PySide6RenderingStyle()
+
+def create_dau_compliant_style(element_type: str) -> PySide6RenderingStyle:
+    """Create Dau-compliant rendering style for specific element types.
+    
+    Styles are immutable, so the shared prototype is returned; use
+    dataclasses.replace() to derive a variant.
+    """
+    return _DAU_STYLES.get(element_type, _DEFAULT_STYLE)
 
 # Contract enforcement integration
 class ContractEnforcedPySide6Renderer:
@@ -158,17 +158,19 @@ class SelectionManager:
             if not high_priority:
                 break
             
-            for suggestion in high_priority:
-                if self.select_element(suggestion.element_id):
-                    added_elements.append(suggestion.element_id)
+            # An element can be suggested more than once (e.g. a vertex repeated
+            # in ν); selecting it twice would toggle it back off in multi modes
+            for element_id in dict.fromkeys(suggestion.element_id for suggestion in high_priority):
+                if element_id not in self.state.selected_elements and self.select_element(element_id):
+                    added_elements.append(element_id)
         
         return added_elements
     
     def get_selected_subgraph_info(self) -> Dict[str, Any]:
         """Get detailed information about the selected subgraph"""
-        vertices = [eid for eid in self.state.selected_elements if eid in self.graph.V]
-        edges = [eid for eid in self.state.selected_elements if eid in self.graph.E]
-        cuts = [eid for eid in self.state.selected_elements if eid in self.graph.Cut]
+        vertices = [eid for eid in self.state.selected_elements if eid in self.graph._vertex_map]
+        edges = [eid for eid in self.state.selected_elements if eid in self.graph._edge_map]
+        cuts = [eid for eid in self.state.selected_elements if eid in self.graph._cut_map]
         
         return {
             'vertices': vertices,
@@ -186,25 +188,23 @@ class SelectionManager:
         issues = []
         
         # Check for orphaned edges (edges without all their vertices selected)
-        for edge_id in [eid for eid in self.state.selected_elements if eid in self.graph.E]:
-            edge = self.graph.E[edge_id]
-            for vertex_id in edge.endpoints:
+        for edge_id in [eid for eid in self.state.selected_elements if eid in self.graph._edge_map]:
+            for vertex_id in self.graph.get_incident_vertices(edge_id):
                 if vertex_id not in self.state.selected_elements:
                     issues.append(f"Edge {edge_id} requires vertex {vertex_id}")
         
         # Check for orphaned vertices in certain contexts
         if self.state.context in [SelectionContext.TRANSFORMATION, SelectionContext.ENCLOSING]:
-            for vertex_id in [eid for eid in self.state.selected_elements if eid in self.graph.V]:
+            for vertex_id in [eid for eid in self.state.selected_elements if eid in self.graph._vertex_map]:
                 # Find edges connected to this vertex
-                connected_edges = [eid for eid, edge in self.graph.E.items() 
-                                 if vertex_id in edge.endpoints]
+                connected_edges = self.graph.get_incident_edges(vertex_id)
                 # If vertex has connected edges, they should be selected too
                 for edge_id in connected_edges:
                     if edge_id not in self.state.selected_elements:
                         issues.append(f"Vertex {vertex_id} is connected to unselected edge {edge_id}")
         
         # Check for cut containment consistency
-        for cut_id in [eid for eid in self.state.selected_elements if eid in self.graph.Cut]:
+        for cut_id in [eid for eid in self.state.selected_elements if eid in self.graph._cut_map]:
             if cut_id in self.graph.area:
                 contained_elements = self.graph.area[cut_id]
                 for element_id in contained_elements:
@@ -246,9 +246,8 @@ class SelectionManager:
         suggestions = []
         
         # Suggest vertices for selected edges
-        for edge_id in [eid for eid in self.state.selected_elements if eid in self.graph.E]:
-            edge = self.graph.E[edge_id]
-            for vertex_id in edge.endpoints:
+        for edge_id in [eid for eid in self.state.selected_elements if eid in self.graph._edge_map]:
+            for vertex_id in self.graph.get_incident_vertices(edge_id):
                 if vertex_id not in self.state.selected_elements:
                     suggestions.append(LogicalSuggestion(
                         element_id=vertex_id,
@@ -258,9 +257,8 @@ class SelectionManager:
         
         # Suggest edges for selected vertices (in certain contexts)
         if self.state.context in [SelectionContext.TRANSFORMATION, SelectionContext.ENCLOSING]:
-            for vertex_id in [eid for eid in self.state.selected_elements if eid in self.graph.V]:
-                connected_edges = [eid for eid, edge in self.graph.E.items() 
-                                 if vertex_id in edge.endpoints]
+            for vertex_id in [eid for eid in self.state.selected_elements if eid in self.graph._vertex_map]:
+                connected_edges = self.graph.get_incident_edges(vertex_id)
                 for edge_id in connected_edges:
                     if edge_id not in self.state.selected_elements:
                         suggestions.append(LogicalSuggestion(
@@ -270,7 +268,7 @@ class SelectionManager:
                         ))
         
         # Suggest contained elements for selected cuts
-        for cut_id in [eid for eid in self.state.selected_elements if eid in self.graph.Cut]:
+        for cut_id in [eid for eid in self.state.selected_elements if eid in self.graph._cut_map]:
             if cut_id in self.graph.area:
                 contained_elements = self.graph.area[cut_id]
                 for element_id in contained_elements:
@@ -17,6 +17,10 @@ from enum import Enum
 import uuid
 
 
+# Vertical side of the boundary for even / odd hook positions
+_HOOK_SIDES = (1, -1)
+
+
 class ElementState(Enum):
     """State of a visual element."""
     UNATTACHED = "unattached"  # Not connected to anything (Warmup mode)
@@ -225,7 +229,7 @@ class PredicateElement(VisualElement):
         # Distribute hooks evenly around the boundary
         angle = (2 * 3.14159 * hook_position) / self.max_arity
         x = self.position.x + self.boundary_radius * (0.8 * (angle / 3.14159))  # Simplified
-        y = self.position.y + self.boundary_radius * 0.3 * (1 if hook_position % 2 == 0 else -1)
+        y = self.position.y + self.boundary_radius * 0.3 * _HOOK_SIDES[hook_position & 1]
         return Coordinate(x, y)
     
     def is_attached(self) -> bool:
@@ -10,12 +10,16 @@ from dataclasses import dataclass
 @dataclass
 class XdotCluster:
     """Represents a cluster (subgraph) with its bounding box."""
+    __slots__ = ('name', 'bb')
+    
     name: str
     bb: Tuple[float, float, float, float]  # x1, y1, x2, y2
 
 @dataclass 
 class XdotNode:
     """Represents a node with its position and dimensions."""
+    __slots__ = ('name', 'pos', 'width', 'height')
+    
     name: str
     pos: Tuple[float, float]  # x, y
     width: float
@@ -24,6 +28,8 @@ class XdotNode:
 @dataclass
 class XdotEdge:
     """Represents an edge with its path points."""
+    __slots__ = ('tail', 'head', 'points')
+    
     tail: str
     head: str
     points: List[Tuple[float, float]]
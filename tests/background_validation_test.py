@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Background Validation Test
+
+Checks the structural validation and deletion feedback produced by the
+background validators on small, well-formed graphs.
+"""
+
+import sys
+import os
+import unittest
+
+# Ensure src directory is in path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from egif_parser_dau import parse_egif
+from eg_transformation_rules import BackgroundValidator, EGTransformationEngine, TransformationRule
+from background_validation_system import RealTimeValidator, ValidationIntegration
+
+
+class GraphStructureValidationTest(unittest.TestCase):
+    """Test BackgroundValidator.validate_graph_structure."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = BackgroundValidator(EGTransformationEngine())
+
+    def test_nested_graph_is_valid(self):
+        """A well-formed graph with nested cuts reports no errors."""
+        graph = parse_egif('*x (Human x) ~[ (Mortal x) ~[ (Wise x) ~[ (Old x) ] ] ]')
+        results = self.validator.validate_graph_structure(graph)
+
+        self.assertTrue(results['is_valid'])
+        self.assertEqual(results['errors'], [])
+
+
+class DeletionValidationTest(unittest.TestCase):
+    """Test orphan warnings from RealTimeValidator deletion feedback."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validator = RealTimeValidator()
+        self.graph = parse_egif('*x (P x) (Q x) (S x x) *y (R y)')
+        self.edge_ids = {self.graph.rel[edge.id]: edge.id for edge in self.graph.E}
+
+    def _orphan_warnings(self, relation_names):
+        selection = {self.edge_ids[name] for name in relation_names}
+        feedback = self.validator.validate_action(self.graph, "delete", selection)
+        self.assertTrue(feedback.is_valid)
+        return [w for w in feedback.warnings if "will become orphaned" in w]
+
+    def test_deleting_only_edge_orphans_vertex(self):
+        """Deleting a vertex's only edge warns that the vertex is orphaned."""
+        self.assertEqual(len(self._orphan_warnings(['R'])), 1)
+
+    def test_deleting_one_of_several_edges_keeps_vertex(self):
+        """Deleting one of a vertex's edges leaves it attached, so no warning."""
+        self.assertEqual(self._orphan_warnings(['P']), [])
+
+    def test_orphan_warning_is_not_repeated(self):
+        """A vertex on several deleted edges is reported once."""
+        self.assertEqual(len(self._orphan_warnings(['P', 'Q', 'S'])), 1)
+
+    def test_validated_deletion_applies(self):
+        """A deletion the validator accepts can be applied as an erasure."""
+        selection = {self.edge_ids['R']}
+        self.assertTrue(self.validator.validate_action(self.graph, "delete", selection).is_valid)
+
+        result = EGTransformationEngine().apply_transformation(
+            self.graph, TransformationRule.ERASURE, elements_to_erase=selection)
+
+        self.assertTrue(result.success, result.error_message)
+        self.assertEqual(sorted(result.new_graph.rel.values()), ['P', 'Q', 'S'])
+        self.assertEqual(len(result.new_graph.V), len(self.graph.V))
+
+    def test_erasing_unknown_element_is_rejected(self):
+        """Erasing an ID that is not in the graph fails validation."""
+        result = EGTransformationEngine().apply_transformation(
+            self.graph, TransformationRule.ERASURE, elements_to_erase=['missing'])
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_message, "Some elements to erase do not exist")
+
+
+class ActionSuggestionTest(unittest.TestCase):
+    """Test ValidationIntegration.get_action_suggestions for single selections."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.integration = ValidationIntegration(RealTimeValidator())
+        self.graph = parse_egif('*x (P x) ~[ (Q x) ]')
+
+    def test_single_element_suggestions(self):
+        """Selecting one vertex, edge or cut yields that element type's suggestions."""
+        graph = self.graph
+        samples = {
+            'vertex': next(iter(graph._vertex_map)),
+            'edge': next(iter(graph._edge_map)),
+            'cut': next(iter(graph._cut_map)),
+        }
+        suggestions = {kind: self.integration.get_action_suggestions(graph, {element_id})
+                       for kind, element_id in samples.items()}
+
+        for kind, kind_suggestions in suggestions.items():
+            with self.subTest(kind=kind):
+                self.assertTrue(kind_suggestions)
+        self.assertEqual(len({tuple(s) for s in suggestions.values()}), 3)
+
+    def test_unknown_element_has_no_suggestions(self):
+        """An ID that is not in the graph gets no suggestions."""
+        self.assertEqual(self.integration.get_action_suggestions(self.graph, {'missing'}), [])
+
+
+def main():
+    """Run background validation tests."""
+    loader = unittest.TestLoader()
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    runner = unittest.TextTestRunner(verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful()
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)